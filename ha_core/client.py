@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 from collections import defaultdict
 
+import requests
+
 try:
     from homeassistant_api import Client
     from homeassistant_api.models import Entity, State, Domain, Service
@@ -105,7 +107,8 @@ class HomeAssistantInspector:
         url: str,
         token: str,
         log_level: int = logging.INFO,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the Home Assistant Inspector
@@ -115,6 +118,9 @@ class HomeAssistantInspector:
             token: Long-lived access token from HA
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             verify_ssl: Whether to verify SSL certificates
+            session: Optional requests.Session to send every API call through,
+                so callers can share one keep-alive connection pool. Note this
+                replaces the library's default response-caching session.
         """
         self.logger = setup_logger(__name__, log_level)
 
@@ -124,7 +130,11 @@ class HomeAssistantInspector:
         self.logger.info(f"Initializing HA Inspector for {api_url}")
 
         try:
-            self.client = Client(api_url, token, verify_ssl=verify_ssl)
+            if session is not None:
+                self.logger.debug("Using caller-provided HTTP session")
+                self.client = Client(api_url, token, verify_ssl=verify_ssl, cache_session=session)
+            else:
+                self.client = Client(api_url, token, verify_ssl=verify_ssl)
             self._verify_connection()
         except HAConnectionError as e:
             self.logger.error(f"Failed to connect to Home Assistant: {e}")
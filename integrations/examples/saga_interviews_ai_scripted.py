@@ -31,9 +31,11 @@ from collections import deque
 from openai import OpenAI
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Shared model loading lives with the squawkers examples
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "squawkers" / "examples"))
 
 from piper import PiperVoice
-from faster_whisper import WhisperModel
+from _models import STT_THREADS, get_stt
 
 # Configuration
 TTS_VOICE = "en_GB-semaine-medium"  # Saga's voice
@@ -327,7 +329,8 @@ def main():
 
     # STT
     print("Loading speech recognition...")
-    stt_model = WhisperModel(stt_model_name, device="cpu", compute_type="int8")
+    # GPU with int8_float16 when CTranslate2 sees one, otherwise CPU int8
+    stt_model = get_stt(stt_model_name, cpu_threads=STT_THREADS)
 
     # VAD
     print("Initializing voice activity detection...")
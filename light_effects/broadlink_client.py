@@ -40,6 +40,22 @@ class BroadlinkRemote:
             "delay_secs": delay_secs
         })
 
+    def send_base64(self, code: str, num_repeats: int = 1, delay_secs: float = 0.4):
+        """
+        Send a raw Broadlink base64 code (no learning required)
+
+        Args:
+            code: Broadlink base64 payload (without the "b64:" prefix)
+            num_repeats: Number of times to repeat the command
+            delay_secs: Delay between repeats
+        """
+        return self.client.call_service("remote", "send_command", {
+            "entity_id": self.entity_id,
+            "command": [f"b64:{code}"],
+            "num_repeats": num_repeats,
+            "delay_secs": delay_secs
+        })
+
     def learn_command(self, command: str, timeout: int = 20):
         """
         Learn a new IR command
@@ -8,8 +8,11 @@ Filters products that:
 - Are actually available (not dead links)
 """
 
+import functools
+import os
+import re
 import requests
-from bs4 import BeautifulSoup
+import orjson
 import time
 import json
 from urllib.parse import quote_plus
@@ -21,6 +24,38 @@ HEADERS = {
     'Accept-Language': 'en-US,en;q=0.5',
 }
 
+# Politeness budget for AliExpress: sustained requests/sec and burst size
+SCRAPE_RATE = float(os.environ.get('SCRAPE_RATE', '2.0'))
+SCRAPE_BURST = int(os.environ.get('SCRAPE_BURST', '2'))
+
+class TokenBucket:
+    """
+    Simple token-bucket rate limiter
+    Lets requests through immediately while tokens remain, and only sleeps
+    when the long-term rate would be exceeded
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """Take one token, sleeping just long enough for one to refill if needed"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 1.0
+            self.updated = time.monotonic()
+
+        self.tokens -= 1
+
+RATE_LIMITER = TokenBucket(SCRAPE_RATE, SCRAPE_BURST)
+
 # Search categories
 SEARCH_QUERIES = {
     'temp_humidity': [
@@ -53,50 +88,74 @@ SEARCH_QUERIES = {
     ],
 }
 
+# Search URL templates - {} is the quote_plus-encoded query
+SEARCH_URL_TMPL = "https://www.aliexpress.us/w/wholesale-{}.html"
+FILTERED_SEARCH_URL_TMPL = SEARCH_URL_TMPL + "?shipFromCountry=CN&shipToCountry=US"
+
+# Encode every query once up front rather than on each URL build
+ENCODED_QUERIES = {q: quote_plus(q) for qs in SEARCH_QUERIES.values() for q in qs}
+
 # Required keywords to validate Zigbee compatibility
-ZIGBEE_KEYWORDS = ['zigbee', 'zigbee 3.0', 'zigbee3.0']
-HA_COMPATIBLE = ['home assistant', 'zigbee2mqtt', 'zha', 'no app required']
-EXCLUDE_KEYWORDS = ['wifi only', 'requires app', 'cloud only', 'tuya app required']
+ZIGBEE_KEYWORDS = frozenset(k.lower() for k in ['zigbee', 'zigbee 3.0', 'zigbee3.0'])
+HA_COMPATIBLE = frozenset(k.lower() for k in ['home assistant', 'zigbee2mqtt', 'zha', 'no app required'])
+EXCLUDE_KEYWORDS = frozenset(k.lower() for k in ['wifi only', 'requires app', 'cloud only', 'tuya app required'])
+
+def _keyword_pattern(keywords):
+    """Compile keywords into one alternation so a listing is scanned in a single pass"""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+ZIGBEE_RE = _keyword_pattern(ZIGBEE_KEYWORDS)
+EXCLUDE_RE = _keyword_pattern(EXCLUDE_KEYWORDS)
+
+# AliExpress embeds its search results as a JSON blob in a <script> tag.
+# Matching it straight off the raw bytes skips building a DOM for ~1 MB pages.
+DIDA_CONFIG_RE = re.compile(
+    rb'window\._dida_config_\s*=\s*(\{.*?\})\s*;?\s*</script>',
+    re.DOTALL,
+)
+
+@functools.lru_cache(maxsize=256)
+def _fetch_products(query, max_results):
+    """
+    Fetch and decode one AliExpress search page (memoized per query)
+
+    Network errors propagate so transient failures are never cached.
+    Returns a tuple so the cached value can't be mutated by callers.
+    """
+    encoded = ENCODED_QUERIES.get(query) or quote_plus(query)
+    url = SEARCH_URL_TMPL.format(encoded)
+
+    RATE_LIMITER.acquire()  # Be polite to servers
+    response = requests.get(url, headers=HEADERS, timeout=15)
+    response.raise_for_status()
+
+    # Pull the embedded product JSON (AliExpress renders with React)
+    match = DIDA_CONFIG_RE.search(response.content)
+    if not match:
+        return ()
+
+    try:
+        data = orjson.loads(match.group(1))
+    except orjson.JSONDecodeError:
+        print(f"  ⚠ Could not decode product data for: {query}")
+        return ()
+
+    return tuple(data.get('items', [])[:max_results])
 
 def search_aliexpress(query, max_results=10):
     """
     Search AliExpress for products matching query
     Returns list of product info dicts
     """
-    url = f"https://www.aliexpress.us/w/wholesale-{quote_plus(query)}.html"
-
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        if response.status_code != 200:
-            print(f"  ⚠ Failed to search: {query} (status {response.status_code})")
-            return []
-
-        # Parse the page - AliExpress uses React/dynamic content
-        # We'll look for common patterns in the HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        products = []
-
-        # Try to find product cards (this structure may change)
-        # AliExpress often has JSON data embedded in script tags
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string and 'window._dida_config_' in script.string:
-                # Try to extract product data from the config
-                try:
-                    # This is a simplified approach
-                    text = script.string
-                    if '"items":' in text:
-                        # Found potential product data
-                        pass
-                except:
-                    pass
-
-        return products
+        return list(_fetch_products(query, max_results))
 
     except requests.exceptions.Timeout:
         print(f"  ⚠ Timeout searching: {query}")
         return []
+    except requests.exceptions.HTTPError as e:
+        print(f"  ⚠ Failed to search: {query} (status {e.response.status_code})")
+        return []
     except Exception as e:
         print(f"  ⚠ Error searching {query}: {e}")
         return []
@@ -117,18 +176,14 @@ def validate_product(product_info):
     - Mentions HA compatibility (bonus)
     - Doesn't require app-only
     """
-    title_lower = product_info.get('title', '').lower()
-    desc_lower = product_info.get('description', '').lower()
-    combined = title_lower + ' ' + desc_lower
+    combined = f"{product_info.get('title', '')} {product_info.get('description', '')}".lower()
 
     # Must have Zigbee
-    has_zigbee = any(kw in combined for kw in ZIGBEE_KEYWORDS)
-    if not has_zigbee:
+    if not ZIGBEE_RE.search(combined):
         return False, "No Zigbee mentioned"
 
     # Check for excludes
-    has_exclude = any(kw in combined for kw in EXCLUDE_KEYWORDS)
-    if has_exclude:
+    if EXCLUDE_RE.search(combined):
         return False, "Requires app or cloud only"
 
     return True, "OK"
@@ -190,11 +245,8 @@ def main():
         for query in queries:
             print(f"  🔍 {query}")
 
-            # Generate search URL
-            search_url = f"https://www.aliexpress.us/w/wholesale-{quote_plus(query)}.html"
-
-            # Add shipping filter to URL
-            search_url += "?shipFromCountry=CN&shipToCountry=US"
+            # Generate search URL with shipping filter
+            search_url = FILTERED_SEARCH_URL_TMPL.format(ENCODED_QUERIES[query])
 
             results[category].append({
                 'title': query,
@@ -203,8 +255,6 @@ def main():
                 'search_query': True,  # Mark as search URL
             })
 
-            time.sleep(1)  # Be polite to servers
-
     # Generate output
     print("\n" + "=" * 60)
     print("Generating shopping guide...")
@@ -248,7 +298,9 @@ def main():
     # Write to file
     output_file = 'ZIGBEE_SHOPPING_GUIDE.md'
     with open(output_file, 'w') as f:
-        f.write('\n'.join(output))
+        # Stream entries straight into the file buffer instead of joining
+        # them into one big string first (same blank-line spacing as before)
+        f.writelines(f"{line}\n" for line in output)
 
     print(f"\n✓ Shopping guide written to: {output_file}")
     print("\n💡 TIP: Open each search URL, then:")
@@ -2,7 +2,7 @@
 Setup script for Home Assistant AI Integration project
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read README
@@ -17,7 +17,9 @@ setup(
     long_description_content_type="text/markdown",
     author="nthmost",
     python_requires=">=3.13",
-    packages=find_packages(exclude=["tests", "docs", "scripts"]),
+    # Explicit list (was find_packages(exclude=["tests", "docs", "scripts"]))
+    # so builds don't walk the whole tree - update when adding a package
+    packages=["ha_core", "light_effects", "squawkers"],
     install_requires=[
         "homeassistant-api>=5.0.2",
         "requests>=2.31.0",
@@ -5,14 +5,21 @@ Converts timing arrays to Broadlink format and provides control interface
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from saga_assistant.ha_client import HomeAssistantClient
-from light_effects.broadlink_client import BroadlinkRemote
 import base64
-import time
+
+from ir_codes import IR_CODES
+from convert_to_broadlink_fixed import ENCODED_CODES, timing_to_broadlink_base64
+
+if TYPE_CHECKING:
+    from saga_assistant.ha_client import HomeAssistantClient
+
+SEP = "=" * 70
+HDR = f"\n{SEP}"
 
 
 def timing_to_pronto(timings: list, frequency: int = 38000) -> str:
@@ -93,50 +100,18 @@ def pronto_to_broadlink(pronto_hex: str) -> str:
     return base64.b64encode(broadlink_data).decode('utf-8')
 
 
-# IR Timing codes from https://github.com/playfultechnology/SquawkersMcGraw
-# Format: {mark, space, mark, space, ...} in microseconds at 38kHz carrier
-
-IR_CODES = {
-    # Common commands across all modes
-    "dance": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 1000],
-    "reset": [3000, 3000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 1000],
-
-    # Response Mode
-    "response_repeat": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000],
-    "response_a": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000],
-    "response_b": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000, 2000, 1000],
-    "response_c": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
-    "response_d": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000],
-    "response_e": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000, 2000, 2000, 1000, 1000],
-    "response_f": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 1000, 2000, 1000],
-    "response_record": [3000, 3000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
-
-    # Command Mode
-    "command_repeat": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
-    "command_a": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000],
-    "command_b": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
-    "command_c": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000],
-    "command_d": [3000, 3000, 1000, 2000, 1100, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1100, 2000, 2000, 1000, 1000],
-    "command_e": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 1000, 2000, 1000],
-    "command_f": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
-    "command_record": [3000, 3000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
-
-    # Gags Mode
-    "gags_repeat": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
-    "gags_a": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
-    "gags_b": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000, 2000, 1000],
-    "gags_c": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000],
-    "gags_d": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000],
-    "gags_e": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
-    "gags_f": [3000, 3000, 1000, 2000, 2000, 1000, 1100, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000],
-    "gags_record": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000],
-}
+# Command names bucketed by mode prefix ("response", "command", "gags"),
+# with un-prefixed commands like dance/reset under "common"
+COMMANDS_BY_MODE = {"response": [], "command": [], "gags": [], "common": []}
+for _name in IR_CODES:
+    _mode = _name.split("_", 1)[0] if "_" in _name else "common"
+    COMMANDS_BY_MODE.setdefault(_mode, []).append(_name)
 
 
 class SquawkersMcGraw:
     """Control interface for Squawkers McGraw animatronic parrot via Broadlink IR"""
 
-    def __init__(self, client: HomeAssistantClient, entity_id: str = "remote.office_lights"):
+    def __init__(self, client: "HomeAssistantClient", entity_id: str = "remote.office_lights"):
         """
         Initialize Squawkers McGraw controller
 
@@ -144,6 +119,10 @@ class SquawkersMcGraw:
             client: HomeAssistantClient instance
             entity_id: Broadlink remote entity ID
         """
+        # Deferred: this pulls in the whole HA client stack, which scripts
+        # that only need IR_CODES / ENCODED_CODES shouldn't pay for
+        from light_effects.broadlink_client import BroadlinkRemote
+
         self.remote = BroadlinkRemote(client, entity_id, "Squawkers McGraw")
         self.client = client
 
@@ -154,26 +133,46 @@ class SquawkersMcGraw:
         """
         Send raw timing array as IR signal
 
-        Note: This requires the Broadlink to support raw timing format.
-        If not supported, commands must be learned first.
+        The timings are encoded into a python-broadlink packet (memoized, so
+        the same timings are only encoded once) and sent as a b64: code, so
+        nothing has to be learned first.
 
         Args:
             timings: List of microsecond timing values
             repeat: Number of times to repeat (GitHub issue suggests multiple repeats)
             delay: Delay between repeats in seconds
         """
-        # Convert to Pronto format
-        pronto = timing_to_pronto(timings)
-        print(f"Pronto Hex: {pronto}")
+        code = timing_to_broadlink_base64(timings)
+        return self.remote.send_base64(code, num_repeats=repeat, delay_secs=delay)
+
+    def send_named(self, command_name: str, repeat: int = 3, delay: Optional[float] = None):
+        """
+        Send a precomputed Broadlink code
+
+        By default the repeat count is written into the packet header so the
+        Broadlink replays the waveform itself: one packet, one service call,
+        protocol-level gaps between repeats. Pass an explicit delay to have
+        Home Assistant re-send the code with that pause instead, using the
+        python-broadlink encoded packets from ENCODED_CODES.
+
+        Args:
+            command_name: Name from IR_CODES dict
+            repeat: Number of times the code should be sent (1-256)
+            delay: Delay between repeats in seconds (None = hardware repeats)
+
+        Raises:
+            ValueError: If repeat is outside 1-256 (the packet's repeat byte
+                holds the extra replays, 0-255)
+        """
+        if not 1 <= repeat <= 256:
+            raise ValueError(f"repeat must be between 1 and 256, got {repeat}")
 
-        # Convert to Broadlink format
-        broadlink_b64 = pronto_to_broadlink(pronto)
-        print(f"Broadlink Base64: {broadlink_b64}")
+        if delay is None:
+            code = timing_to_broadlink_base64(IR_CODES[command_name], repeats=repeat - 1)
+            return self.remote.send_base64(code)
 
-        # Send via Home Assistant
-        # Note: This may require custom integration or learning mode
-        print(f"⚠️  Raw IR sending not yet implemented - use learn mode instead")
-        return None
+        code = ENCODED_CODES[command_name]
+        return self.remote.send_base64(code, num_repeats=repeat, delay_secs=delay)
 
     def test_command(self, command_name: str, repeat: int = 3):
         """
@@ -191,12 +190,9 @@ class SquawkersMcGraw:
         print(f"🔊 Testing command: {command_name}")
         print(f"   Repeating {repeat} times with gentle pauses...")
 
-        timings = IR_CODES[command_name]
-
-        for i in range(repeat):
-            print(f"   Attempt {i+1}/{repeat}...")
-            self.send_raw_timing(timings, repeat=1)
-            time.sleep(0.5)  # "Gentle pause" between repeats
+        # One service call - the Broadlink handles the repeats and the
+        # 0.5s "gentle pause" between them locally
+        self.send_named(command_name, repeat=repeat, delay=0.5)
 
         print(f"✅ Test complete for: {command_name}")
         print(f"📝 What happened? (Document the behavior)")
@@ -256,45 +252,47 @@ class SquawkersMcGraw:
 
     def get_response_mode_commands(self):
         """Return list of Response Mode commands"""
-        return [k for k in IR_CODES.keys() if k.startswith("response_")]
+        return COMMANDS_BY_MODE["response"].copy()
 
     def get_command_mode_commands(self):
         """Return list of Command Mode commands"""
-        return [k for k in IR_CODES.keys() if k.startswith("command_")]
+        return COMMANDS_BY_MODE["command"].copy()
 
     def get_gags_mode_commands(self):
         """Return list of Gags Mode commands"""
-        return [k for k in IR_CODES.keys() if k.startswith("gags_")]
+        return COMMANDS_BY_MODE["gags"].copy()
 
     def print_all_codes(self):
         """Print all IR codes for reference"""
-        print("\n" + "="*70)
-        print("SQUAWKERS MCGRAW IR CODES")
-        print("="*70)
+        out = [HDR, "SQUAWKERS MCGRAW IR CODES", SEP]
 
-        print("\n🎭 COMMON COMMANDS:")
+        out.append("\n🎭 COMMON COMMANDS:")
         for cmd in ["dance", "reset"]:
-            print(f"  {cmd:20} {IR_CODES[cmd]}")
+            out.append(f"  {cmd:20} {IR_CODES[cmd]}")
 
-        print("\n📻 RESPONSE MODE:")
+        out.append("\n📻 RESPONSE MODE:")
         for cmd in self.get_response_mode_commands():
-            print(f"  {cmd:20} {IR_CODES[cmd]}")
+            out.append(f"  {cmd:20} {IR_CODES[cmd]}")
 
-        print("\n🎮 COMMAND MODE:")
+        out.append("\n🎮 COMMAND MODE:")
         for cmd in self.get_command_mode_commands():
-            print(f"  {cmd:20} {IR_CODES[cmd]}")
+            out.append(f"  {cmd:20} {IR_CODES[cmd]}")
 
-        print("\n😂 GAGS MODE:")
+        out.append("\n😂 GAGS MODE:")
         for cmd in self.get_gags_mode_commands():
-            print(f"  {cmd:20} {IR_CODES[cmd]}")
+            out.append(f"  {cmd:20} {IR_CODES[cmd]}")
+
+        out.append(HDR)
 
-        print("\n" + "="*70)
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 # Test/demo script
 if __name__ == "__main__":
     import os
     from dotenv import load_dotenv
+    from saga_assistant.ha_client import HomeAssistantClient
 
     # Load environment variables
     load_dotenv()
@@ -307,7 +305,7 @@ if __name__ == "__main__":
 
     # Initialize
     print("🦜 Squawkers McGraw Broadlink Control")
-    print("="*70)
+    print(SEP)
 
     client = HomeAssistantClient(HA_URL, HA_TOKEN)
     squawkers = SquawkersMcGraw(client)
@@ -4,8 +4,14 @@ Convert Squawkers IR timing codes to Broadlink base64 format
 This allows sending codes WITHOUT learning from remote!
 """
 
+import base64
+import io
 import struct
-from broadlink_squawkers import IR_CODES
+import sys
+from ir_codes import IR_CODES
+
+SEP = "=" * 70
+HDR = f"\n{SEP}"
 
 def timing_to_broadlink_base64(timings, frequency=38000):
     """
@@ -19,100 +25,91 @@ def timing_to_broadlink_base64(timings, frequency=38000):
 
     Each timing value is converted to units of ~30.5μs (2^-15 seconds)
     """
-    import base64
-
     # Broadlink uses units of 2^-15 seconds (~30.5 microseconds)
     BROADLINK_UNIT = 32.84  # microseconds per unit (1000000 / 30.5)
 
     # Convert timings to Broadlink units
-    pulse_data = []
-    for timing_us in timings:
-        # Convert microseconds to Broadlink units
-        units = int(round(timing_us / BROADLINK_UNIT))
-        # Pack as little-endian uint16
-        pulse_data.append(struct.pack('<H', units))
-
-    # Build the full packet
-    packet = bytearray()
-    packet.append(0x26)  # IR command type
-    packet.append(0x00)  # Repeat count (0 = send once)
-
-    # Length of pulse data (in bytes)
-    pulse_bytes = b''.join(pulse_data)
-    length = len(pulse_bytes)
-    packet.extend(struct.pack('<H', length))  # Little-endian uint16
-
-    # Add pulse data
-    packet.extend(pulse_bytes)
+    units = [int(round(timing_us / BROADLINK_UNIT)) for timing_us in timings]
+
+    # Pack all pulses as little-endian uint16 in a single call
+    pulse_bytes = struct.pack(f'<{len(units)}H', *units)
+
+    # Header: IR command type (0x26), repeat count (0 = send once),
+    # length of pulse data in bytes (little-endian uint16)
+    header = struct.pack('<BBH', 0x26, 0x00, len(pulse_bytes))
 
     # Encode as base64
-    return base64.b64encode(packet).decode('utf-8')
+    return base64.b64encode(header + pulse_bytes).decode('ascii')
 
 
 def main():
-    print("\n" + "="*70)
-    print("SQUAWKERS MCGRAW - BROADLINK BASE64 CODES")
-    print("="*70)
-    print("\nConverting timing arrays to Broadlink format...")
-    print("These can be sent directly via Home Assistant!\n")
+    # Buffer all output and emit it with one write at the end
+    buf = io.StringIO()
+
+    print(HDR, file=buf)
+    print("SQUAWKERS MCGRAW - BROADLINK BASE64 CODES", file=buf)
+    print(SEP, file=buf)
+    print("\nConverting timing arrays to Broadlink format...", file=buf)
+    print("These can be sent directly via Home Assistant!\n", file=buf)
 
     converted = {}
 
-    print("🎭 COMMON COMMANDS:")
+    print("🎭 COMMON COMMANDS:", file=buf)
     for cmd in ["dance", "reset"]:
         b64 = timing_to_broadlink_base64(IR_CODES[cmd])
         converted[cmd] = b64
-        print(f"\n{cmd}:")
-        print(f"  {b64}")
+        print(f"\n{cmd}:", file=buf)
+        print(f"  {b64}", file=buf)
 
-    print("\n" + "="*70)
-    print("📻 RESPONSE MODE:")
+    print(HDR, file=buf)
+    print("📻 RESPONSE MODE:", file=buf)
     for letter in "ABCDEF":
         cmd = f"response_{letter.lower()}"
         b64 = timing_to_broadlink_base64(IR_CODES[cmd])
         converted[cmd] = b64
-        print(f"\n{cmd}:")
-        print(f"  {b64}")
+        print(f"\n{cmd}:", file=buf)
+        print(f"  {b64}", file=buf)
 
-    print("\n" + "="*70)
-    print("🎮 COMMAND MODE:")
+    print(HDR, file=buf)
+    print("🎮 COMMAND MODE:", file=buf)
     for letter in "ABCDEF":
         cmd = f"command_{letter.lower()}"
         b64 = timing_to_broadlink_base64(IR_CODES[cmd])
         converted[cmd] = b64
-        print(f"\n{cmd}:")
-        print(f"  {b64}")
+        print(f"\n{cmd}:", file=buf)
+        print(f"  {b64}", file=buf)
 
-    print("\n" + "="*70)
-    print("😂 GAGS MODE:")
+    print(HDR, file=buf)
+    print("😂 GAGS MODE:", file=buf)
     for letter in "ABCDEF":
         cmd = f"gags_{letter.lower()}"
         b64 = timing_to_broadlink_base64(IR_CODES[cmd])
         converted[cmd] = b64
-        print(f"\n{cmd}:")
-        print(f"  {b64}")
+        print(f"\n{cmd}:", file=buf)
+        print(f"  {b64}", file=buf)
 
-    print("\n" + "="*70)
-    print(f"✅ Converted {len(converted)} commands to Broadlink format")
-    print("="*70)
+    print(HDR, file=buf)
+    print(f"✅ Converted {len(converted)} commands to Broadlink format", file=buf)
+    print(SEP, file=buf)
 
     # Save to file
     output_file = "broadlink_codes.txt"
     with open(output_file, "w") as f:
         f.write("# Squawkers McGraw Broadlink Base64 Codes\n")
         f.write("# Generated from timing arrays\n\n")
-        for cmd, b64 in converted.items():
-            f.write(f"{cmd}: {b64}\n")
-
-    print(f"\n💾 Saved to: {output_file}")
-
-    print("\n📝 NEXT STEP:")
-    print("   Use these base64 codes with Home Assistant's remote.send_command")
-    print("   Example:")
-    print("   service: remote.send_command")
-    print("   data:")
-    print("     entity_id: remote.office_lights")
-    print(f'     command: "{converted["dance"]}"')
+        f.write("".join(f"{cmd}: {b64}\n" for cmd, b64 in converted.items()))
+
+    print(f"\n💾 Saved to: {output_file}", file=buf)
+
+    print("\n📝 NEXT STEP:", file=buf)
+    print("   Use these base64 codes with Home Assistant's remote.send_command", file=buf)
+    print("   Example:", file=buf)
+    print("   service: remote.send_command", file=buf)
+    print("   data:", file=buf)
+    print("     entity_id: remote.office_lights", file=buf)
+    print(f'     command: "{converted["dance"]}"', file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
     return converted
 
@@ -4,9 +4,18 @@ Convert Squawkers IR timing codes to Broadlink base64 format
 Using the CORRECT formula from python-broadlink library
 """
 
-import struct
 import base64
-from broadlink_squawkers import IR_CODES
+import io
+import struct
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+from ir_codes import IR_CODES
+
+SEP = "=" * 70
+HDR = f"\n{SEP}"
 
 
 def pulses_to_broadlink(pulses):
@@ -16,42 +25,58 @@ def pulses_to_broadlink(pulses):
     Formula from python-broadlink: pulse * 269 / 8192
     Each value can be 1 or 2 bytes (if > 255, use big-endian with leading 0x00)
     """
-    packet = bytearray()
+    arr = np.asarray(pulses, dtype=np.int64)
+    if (arr < 0).any():
+        raise ValueError("Pulse durations must be non-negative")
+
+    # Convert microseconds to Broadlink units in one vectorized pass
+    # Formula: pulse * 269 / 8192. Since 8192 == 1 << 13, a right shift is
+    # the same as the truncating divide for non-negative pulses, and stays
+    # in integer arithmetic
+    encoded = (arr * 269) >> 13
 
-    for pulse_us in pulses:
-        # Convert microseconds to Broadlink units
-        # Formula: pulse * 269 / 8192
-        pulse_encoded = int(pulse_us * 269 / 8192)
+    # Fast path: every value fits in one byte
+    big = encoded > 0xFF
+    if not big.any():
+        return encoded.astype(np.uint8).tobytes()
 
-        # If value fits in one byte
-        if pulse_encoded <= 0xFF:
-            packet.append(pulse_encoded)
-        else:
-            # Big-endian encoding with leading 0x00
-            packet.append(0x00)
-            packet.append((pulse_encoded >> 8) & 0xFF)  # High byte
-            packet.append(pulse_encoded & 0xFF)         # Low byte
+    # Mixed case: large values take 3 bytes (0x00, high, low), small ones 1.
+    # Work out each value's offset in the output, then scatter into place.
+    widths = 1 + 2 * big
+    offsets = np.cumsum(widths) - widths
 
-    return packet
+    packet = np.zeros(int(widths.sum()), dtype=np.uint8)
+    packet[offsets[~big]] = encoded[~big]
+    packet[offsets[big] + 1] = (encoded[big] >> 8) & 0xFF  # High byte
+    packet[offsets[big] + 2] = encoded[big] & 0xFF         # Low byte
 
+    return packet.tobytes()
 
-def timing_to_broadlink_base64(timings):
+
+def timing_to_broadlink_base64(timings, repeats=0):
     """
     Convert timing array to complete Broadlink base64 packet
 
     Packet structure:
     - Byte 0: 0x26 (IR command)
-    - Byte 1: 0x00 (repeat count)
+    - Byte 1: repeat count (0 = send once; the device replays it N more times)
     - Bytes 2-3: Length of pulse data (little-endian)
     - Bytes 4+: Pulse data
     """
+    # Lists aren't hashable, so key the cache on a tuple of the timings
+    return _encode_timings(tuple(timings), repeats)
+
+
+@lru_cache(maxsize=None)
+def _encode_timings(timings, repeats):
+    """Build and base64-encode the Broadlink packet (memoized per timing tuple)"""
     # Encode the pulses
     pulse_data = pulses_to_broadlink(timings)
 
     # Build packet
     packet = bytearray()
     packet.append(0x26)  # IR command type
-    packet.append(0x00)  # Repeat once
+    packet.append(repeats)  # Extra hardware replays (0-255)
 
     # Length as little-endian uint16
     length = len(pulse_data)
@@ -64,46 +89,53 @@ def timing_to_broadlink_base64(timings):
     return base64.b64encode(packet).decode('utf-8')
 
 
+# Every IR_CODES entry encoded once at import, so send paths are a dict lookup
+ENCODED_CODES = {name: timing_to_broadlink_base64(pulses) for name, pulses in IR_CODES.items()}
+
+
 def main():
-    print("\n" + "="*70)
-    print("SQUAWKERS MCGRAW - CORRECTED BROADLINK CODES")
-    print("="*70)
-    print("\nUsing python-broadlink formula: pulse * 269 / 8192")
-    print()
+    # Buffer all output and emit it with one write at the end
+    buf = io.StringIO()
+
+    print(HDR, file=buf)
+    print("SQUAWKERS MCGRAW - CORRECTED BROADLINK CODES", file=buf)
+    print(SEP, file=buf)
+    print("\nUsing python-broadlink formula: pulse * 269 / 8192", file=buf)
+    print(file=buf)
 
     converted = {}
 
     # Test with dance command first
-    print("🎭 Testing DANCE command encoding:")
+    print("🎭 Testing DANCE command encoding:", file=buf)
     dance_timings = IR_CODES["dance"]
-    print(f"   Timings: {dance_timings}")
+    print(f"   Timings: {dance_timings}", file=buf)
 
-    dance_b64 = timing_to_broadlink_base64(dance_timings)
+    dance_b64 = ENCODED_CODES["dance"]
     converted["dance"] = dance_b64
-    print(f"   Base64:  {dance_b64}")
-    print()
+    print(f"   Base64:  {dance_b64}", file=buf)
+    print(file=buf)
 
     # Convert all commands
-    print("Converting all commands...\n")
+    print("Converting all commands...\n", file=buf)
 
-    for cmd_name, timings in IR_CODES.items():
-        b64 = timing_to_broadlink_base64(timings)
+    for cmd_name, b64 in ENCODED_CODES.items():
         converted[cmd_name] = b64
-        print(f"{cmd_name:20} {b64}")
+        print(f"{cmd_name:20} {b64}", file=buf)
 
-    print("\n" + "="*70)
-    print(f"✅ Converted {len(converted)} commands")
-    print("="*70)
+    print(HDR, file=buf)
+    print(f"✅ Converted {len(converted)} commands", file=buf)
+    print(SEP, file=buf)
 
     # Save to file
     output_file = "broadlink_codes_fixed.txt"
     with open(output_file, "w") as f:
         f.write("# Squawkers McGraw Broadlink Base64 Codes (FIXED)\n")
         f.write("# Using python-broadlink formula: pulse * 269 / 8192\n\n")
-        for cmd, b64 in converted.items():
-            f.write(f"{cmd}: {b64}\n")
+        f.write("".join(f"{cmd}: {b64}\n" for cmd, b64 in converted.items()))
+
+    print(f"\n💾 Saved to: {output_file}", file=buf)
 
-    print(f"\n💾 Saved to: {output_file}")
+    sys.stdout.write(buf.getvalue())
 
     return converted
 
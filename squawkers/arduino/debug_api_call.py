@@ -5,12 +5,25 @@ Debug what's actually being sent to Home Assistant API
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 HA_URL = os.getenv("HA_URL", "http://homeassistant.local:8123")
 HA_TOKEN = os.getenv("HA_TOKEN")
 
+# Set DEBUG_FULL=1 to print full payloads and responses
+DEBUG_FULL = bool(os.getenv("DEBUG_FULL"))
+
+
+def _short(value, limit=80):
+    """Render value for display, truncated unless DEBUG_FULL is set"""
+    text = str(value)
+    if DEBUG_FULL or len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<{len(text) - limit} more>"
+
+
 # Test base64 code
 test_code = "JgAiAFsAWwAeAD0APQAeAB4APQA9AB4APQAeAB4APQA9AB4AHgA="
 
@@ -21,47 +34,39 @@ headers = {
     "Content-Type": "application/json",
 }
 
-# Test 1: With b64: prefix as list
-print("Test 1: command as list with b64: prefix")
-data1 = {
-    "entity_id": "remote.office_lights",
-    "command": [f"b64:{test_code}"]
-}
-print(f"Data: {data1}")
-response = requests.post(f"{HA_URL}/api/services/remote/send_command", headers=headers, json=data1)
-print(f"Status: {response.status_code}")
-print(f"Response: {response.text}\n")
+url = f"{HA_URL}/api/services/remote/send_command"
 
-# Test 2: Without b64: prefix
-print("Test 2: command as list without b64: prefix")
-data2 = {
-    "entity_id": "remote.office_lights",
-    "command": [test_code]
-}
-print(f"Data: {data2}")
-response = requests.post(f"{HA_URL}/api/services/remote/send_command", headers=headers, json=data2)
-print(f"Status: {response.status_code}")
-print(f"Response: {response.text}\n")
+tests = [
+    ("Test 1: command as list with b64: prefix", {
+        "entity_id": "remote.office_lights",
+        "command": [f"b64:{test_code}"]
+    }),
+    ("Test 2: command as list without b64: prefix", {
+        "entity_id": "remote.office_lights",
+        "command": [test_code]
+    }),
+    # Just the base64 string (not in list)
+    ("Test 3: command as string with b64: prefix", {
+        "entity_id": "remote.office_lights",
+        "command": f"b64:{test_code}"
+    }),
+    # With device parameter (like learned codes)
+    ("Test 4: With device parameter + b64: prefix", {
+        "entity_id": "remote.office_lights",
+        "device": "Squawkers McGraw",
+        "command": [f"b64:{test_code}"]
+    }),
+]
 
-# Test 3: Just the base64 string (not in list)
-print("Test 3: command as string with b64: prefix")
-data3 = {
-    "entity_id": "remote.office_lights",
-    "command": f"b64:{test_code}"
-}
-print(f"Data: {data3}")
-response = requests.post(f"{HA_URL}/api/services/remote/send_command", headers=headers, json=data3)
-print(f"Status: {response.status_code}")
-print(f"Response: {response.text}\n")
+# One keep-alive session for all probes instead of a new connection each
+with requests.Session() as session:
+    session.headers.update(headers)
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
-# Test 4: With device parameter (like learned codes)
-print("Test 4: With device parameter + b64: prefix")
-data4 = {
-    "entity_id": "remote.office_lights",
-    "device": "Squawkers McGraw",
-    "command": [f"b64:{test_code}"]
-}
-print(f"Data: {data4}")
-response = requests.post(f"{HA_URL}/api/services/remote/send_command", headers=headers, json=data4)
-print(f"Status: {response.status_code}")
-print(f"Response: {response.text}\n")
+    for label, data in tests:
+        print(label)
+        print(f"Data: {_short(data)}")
+        response = session.post(url, json=data)
+        print(f"Status: {response.status_code}")
+        print(f"Response: {_short(response.text, 200)}\n")
@@ -0,0 +1,44 @@
+"""
+Squawkers McGraw IR timing codes
+Kept free of Home Assistant / Broadlink imports so demo and conversion
+scripts can load the table without pulling in the client stack
+"""
+
+# IR Timing codes from https://github.com/playfultechnology/SquawkersMcGraw
+# Format: {mark, space, mark, space, ...} in microseconds at 38kHz carrier
+
+IR_CODES = {
+    # Common commands across all modes
+    "dance": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 1000],
+    "reset": [3000, 3000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 1000],
+
+    # Response Mode
+    "response_repeat": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000],
+    "response_a": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000],
+    "response_b": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000, 2000, 1000],
+    "response_c": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
+    "response_d": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000],
+    "response_e": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000, 2000, 2000, 1000, 1000],
+    "response_f": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 1000, 2000, 1000],
+    "response_record": [3000, 3000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
+
+    # Command Mode
+    "command_repeat": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
+    "command_a": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000],
+    "command_b": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
+    "command_c": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000],
+    "command_d": [3000, 3000, 1000, 2000, 1100, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 1100, 2000, 2000, 1000, 1000],
+    "command_e": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 1000, 2000, 1000],
+    "command_f": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
+    "command_record": [3000, 3000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
+
+    # Gags Mode
+    "gags_repeat": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
+    "gags_a": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 2000, 1000, 1000],
+    "gags_b": [3000, 3000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000, 2000, 1000],
+    "gags_c": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 2000, 1000, 1000],
+    "gags_d": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 1000],
+    "gags_e": [3000, 3000, 1000, 2000, 1000, 2000, 2000, 1000, 2000, 1000, 1000, 2000, 2000, 1000, 2000, 1000, 1000],
+    "gags_f": [3000, 3000, 1000, 2000, 2000, 1000, 1100, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000],
+    "gags_record": [3000, 3000, 1000, 2000, 2000, 1000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000],
+}
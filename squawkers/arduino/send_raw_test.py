@@ -18,6 +18,9 @@ load_dotenv()
 HA_URL = os.getenv("HA_URL", "http://homeassistant.local:8123")
 HA_TOKEN = os.getenv("HA_TOKEN")
 
+SEP = "=" * 70
+HDR = f"\n{SEP}"
+
 # Base64 codes (from convert_to_broadlink.py)
 CODES = {
     "dance": "JgAiAFsAWwAeAD0APQAeAB4APQA9AB4APQAeAB4APQA9AB4AHgA=",
@@ -65,9 +68,9 @@ def main():
         print("❌ Error: HA_TOKEN not found in .env")
         return
 
-    print("\n" + "="*70)
+    print(HDR)
     print("🦜 SQUAWKERS MCGRAW - RAW CODE TEST")
-    print("="*70)
+    print(SEP)
     print(f"\nHome Assistant: {HA_URL}")
     print("Broadlink: remote.office_lights")
     print("\n⚠️  Make sure Squawkers is:")
@@ -80,9 +83,9 @@ def main():
 
     # Test menu
     while True:
-        print("\n" + "="*70)
+        print(HDR)
         print("Which command do you want to test?")
-        print("="*70)
+        print(SEP)
         print("1. Dance (should make Squawkers dance)")
         print("2. Reset (should stop/reset)")
         print("3. Response Mode - Button A (unknown behavior)")
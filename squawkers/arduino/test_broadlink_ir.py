@@ -17,9 +17,12 @@ load_dotenv()
 HA_URL = os.getenv("HA_URL", "http://homeassistant.local:8123")
 HA_TOKEN = os.getenv("HA_TOKEN")
 
-print("\n" + "="*70)
+SEP = "=" * 70
+HDR = f"\n{SEP}"
+
+print(HDR)
 print("🔍 BROADLINK IR TRANSMISSION TEST")
-print("="*70)
+print(SEP)
 
 print("\nFirst, let's verify Broadlink is working AT ALL...")
 print("\nStep 1: Test with a known-working command (Office Lights)")
@@ -55,9 +58,9 @@ except Exception as e:
     print(f"❌ Error: {e}")
     exit(1)
 
-print("\n" + "="*70)
+print(HDR)
 print("Step 2: Physical positioning test for Squawkers")
-print("="*70)
+print(SEP)
 
 print("\nPosition check:")
 print("1. Where is Squawkers relative to the Broadlink?")
@@ -68,9 +71,9 @@ print()
 
 input("Press ENTER when Squawkers is optimally positioned...")
 
-print("\n" + "="*70)
+print(HDR)
 print("Step 3: Test if Squawkers is even ON and responsive")
-print("="*70)
+print(SEP)
 
 print("\nManual test:")
 print("1. Does Squawkers have batteries?")
@@ -90,9 +93,9 @@ if response != 'y':
 
 print("\n✅ Squawkers is alive and responsive")
 
-print("\n" + "="*70)
+print(HDR)
 print("Step 4: Understanding the IR protocol issue")
-print("="*70)
+print(SEP)
 
 print("\nPossible problems with our codes:")
 print("1. Timing conversion math might be wrong")
@@ -17,6 +17,9 @@ load_dotenv()
 HA_URL = os.getenv("HA_URL", "http://homeassistant.local:8123")
 HA_TOKEN = os.getenv("HA_TOKEN")
 
+SEP = "=" * 70
+HDR = f"\n{SEP}"
+
 # FIXED codes using correct python-broadlink formula
 FIXED_CODES = {
     "dance": "JgARAGJiIEFBICBBQSBBICBBQSAg",
@@ -25,9 +28,9 @@ FIXED_CODES = {
     "response_b": "JgARAGJiIEEgQSBBQSAgQUEgIEEg",
 }
 
-print("\n" + "="*70)
+print(HDR)
 print("🦜 TESTING FIXED BROADLINK CODES")
-print("="*70)
+print(SEP)
 print("\nThese use the CORRECT python-broadlink encoding formula")
 print("Old code: JgAiAFsAWwAeAD0APQAeAB4APQA9AB4APQAeAB4APQA9AB4AHgA=")
 print("New code: JgARAGJiIEFBICBBQSBBICBBQSAg")
@@ -54,9 +57,9 @@ for i in range(5):
     except Exception as e:
         print(f"❌ {e}")
 
-print("\n" + "="*70)
+print(HDR)
 print("👀 DID SQUAWKERS DANCE?")
-print("="*70)
+print(SEP)
 response = input("(y/n): ").lower()
 
 if response == 'y':
@@ -16,6 +16,57 @@ from saga_assistant.ha_client import HomeAssistantClient
 from squawkers.broadlink_squawkers import SquawkersMcGraw, IR_CODES
 import time
 
+SEP = "=" * 70
+HDR = f"\n{SEP}"
+
+BEHAVIORS_FILE = Path(__file__).parent / "discovered_behaviors.txt"
+
+COMMANDS_TO_LEARN = [
+    ("dance", "Dance button"),
+    ("reset", "Reset button"),
+    ("response_a", "Response Mode - Button A"),
+    ("response_b", "Response Mode - Button B"),
+    ("response_c", "Response Mode - Button C"),
+    ("response_d", "Response Mode - Button D"),
+    ("response_e", "Response Mode - Button E"),
+    ("response_f", "Response Mode - Button F"),
+    ("command_a", "Command Mode - Button A"),
+    ("command_b", "Command Mode - Button B"),
+    ("command_c", "Command Mode - Button C"),
+    ("command_d", "Command Mode - Button D"),
+    ("command_e", "Command Mode - Button E"),
+    ("command_f", "Command Mode - Button F"),
+    ("gags_a", "Gags Mode - Button A"),
+    ("gags_b", "Gags Mode - Button B"),
+    ("gags_c", "Gags Mode - Button C"),
+    ("gags_d", "Gags Mode - Button D"),
+    ("gags_e", "Gags Mode - Button E"),
+    ("gags_f", "Gags Mode - Button F"),
+]
+
+INTERACTIVE_MENU = f"""{HDR}
+SQUAWKERS MCGRAW INTERACTIVE TEST
+{SEP}
+
+1. Test dance command
+2. Test reset command
+3. Test Response Mode commands (A-F)
+4. Test Command Mode commands (A-F)
+5. Test Gags Mode commands (A-F)
+6. Test specific command by name
+7. List all commands
+8. View discovered behaviors
+9. Exit
+"""
+
+# Button listings for the A-F submenus, keyed by mode prefix
+MODE_MENUS = {
+    mode: f"\n{title} buttons:\n" + "\n".join(
+        f"  {letter}: {mode}_{letter.lower()}" for letter in "ABCDEF"
+    )
+    for mode, title in [("response", "Response Mode"), ("command", "Command Mode"), ("gags", "Gags Mode")]
+}
+
 
 def learn_all_commands(squawkers: SquawkersMcGraw):
     """
@@ -27,9 +78,9 @@ def learn_all_commands(squawkers: SquawkersMcGraw):
     Broadlink doesn't support raw timing uploads via API, so this will
     guide you through the process.
     """
-    print("\n" + "="*70)
+    print(HDR)
     print("IR COMMAND LEARNING GUIDE")
-    print("="*70)
+    print(SEP)
 
     print("\n⚠️  IMPORTANT: Broadlink requires learned codes")
     print("Since you don't have the original remote, we have two options:")
@@ -58,40 +109,16 @@ def learn_all_commands(squawkers: SquawkersMcGraw):
 def learn_from_remote(squawkers: SquawkersMcGraw):
     """Guide user through learning commands from original remote"""
 
-    print("\n" + "="*70)
+    print(HDR)
     print("LEARNING COMMANDS FROM REMOTE")
-    print("="*70)
-
-    commands_to_learn = [
-        ("dance", "Dance button"),
-        ("reset", "Reset button"),
-        ("response_a", "Response Mode - Button A"),
-        ("response_b", "Response Mode - Button B"),
-        ("response_c", "Response Mode - Button C"),
-        ("response_d", "Response Mode - Button D"),
-        ("response_e", "Response Mode - Button E"),
-        ("response_f", "Response Mode - Button F"),
-        ("command_a", "Command Mode - Button A"),
-        ("command_b", "Command Mode - Button B"),
-        ("command_c", "Command Mode - Button C"),
-        ("command_d", "Command Mode - Button D"),
-        ("command_e", "Command Mode - Button E"),
-        ("command_f", "Command Mode - Button F"),
-        ("gags_a", "Gags Mode - Button A"),
-        ("gags_b", "Gags Mode - Button B"),
-        ("gags_c", "Gags Mode - Button C"),
-        ("gags_d", "Gags Mode - Button D"),
-        ("gags_e", "Gags Mode - Button E"),
-        ("gags_f", "Gags Mode - Button F"),
-    ]
-
-    print(f"\nWe'll learn {len(commands_to_learn)} commands.")
+    print(SEP)
+    print(f"\nWe'll learn {len(COMMANDS_TO_LEARN)} commands.")
     print("For each command, you'll have 20 seconds to press the button on the remote.")
     print()
 
     learned_count = 0
 
-    for cmd_name, description in commands_to_learn:
+    for cmd_name, description in COMMANDS_TO_LEARN:
         print(f"\n📡 Learning: {description}")
         print(f"   Command name: {cmd_name}")
 
@@ -113,12 +140,12 @@ def learn_from_remote(squawkers: SquawkersMcGraw):
                 except Exception as e:
                     print(f"❌ Failed again: {e}")
 
-    print(f"\n" + "="*70)
-    print(f"✅ Learned {learned_count}/{len(commands_to_learn)} commands")
-    print("="*70)
+    print(HDR)
+    print(f"✅ Learned {learned_count}/{len(COMMANDS_TO_LEARN)} commands")
+    print(SEP)
 
 
-def test_command(squawkers: SquawkersMcGraw, command_name: str):
+def test_command(squawkers: SquawkersMcGraw, command_name: str, behaviors_fh):
     """Test a single command and document the behavior"""
 
     print(f"\n🔊 Testing: {command_name}")
@@ -152,100 +179,88 @@ def test_command(squawkers: SquawkersMcGraw, command_name: str):
             squawkers.document_behavior(command_name, behavior)
 
             # Save to file
-            save_behavior(command_name, behavior)
+            save_behavior(behaviors_fh, command_name, behavior)
 
     except Exception as e:
         print(f"❌ Error sending command: {e}")
 
 
-def save_behavior(command_name: str, description: str):
-    """Save discovered behavior to file"""
-    behaviors_file = Path(__file__).parent / "discovered_behaviors.txt"
+def save_behavior(behaviors_fh, command_name: str, description: str):
+    """Save discovered behavior to the session's open behaviors file"""
+    behaviors_fh.write(f"{command_name}: {description}\n")
+
+    print(f"💾 Saved to: {BEHAVIORS_FILE}")
+
+
+def test_mode_button(squawkers: SquawkersMcGraw, mode: str, behaviors_fh):
+    """Prompt for an A-F button in the given mode and test it"""
+    print(MODE_MENUS[mode])
+    button = input("Which button? (A-F): ").strip().upper()
+    if button in "ABCDEF":
+        test_command(squawkers, f"{mode}_{button.lower()}", behaviors_fh)
+
+
+def test_named_command(squawkers: SquawkersMcGraw, behaviors_fh):
+    """Prompt for a command name and test it"""
+    cmd = input("Command name: ").strip()
+    if cmd in IR_CODES:
+        test_command(squawkers, cmd, behaviors_fh)
+    else:
+        print(f"❌ Unknown command: {cmd}")
+        print(f"Available: {', '.join(IR_CODES.keys())}")
 
-    with open(behaviors_file, "a") as f:
-        f.write(f"{command_name}: {description}\n")
 
-    print(f"💾 Saved to: {behaviors_file}")
+# Interactive menu option -> handler(squawkers, behaviors_fh)
+MENU_HANDLERS = {
+    "1": lambda s, fh: test_command(s, "dance", fh),
+    "2": lambda s, fh: test_command(s, "reset", fh),
+    "3": lambda s, fh: test_mode_button(s, "response", fh),
+    "4": lambda s, fh: test_mode_button(s, "command", fh),
+    "5": lambda s, fh: test_mode_button(s, "gags", fh),
+    "6": test_named_command,
+    "7": lambda s, fh: s.print_all_codes(),
+    "8": lambda s, fh: view_behaviors(),
+}
 
 
 def interactive_test(squawkers: SquawkersMcGraw):
     """Interactive testing menu"""
 
-    while True:
-        print("\n" + "="*70)
-        print("SQUAWKERS MCGRAW INTERACTIVE TEST")
-        print("="*70)
-        print()
-        print("1. Test dance command")
-        print("2. Test reset command")
-        print("3. Test Response Mode commands (A-F)")
-        print("4. Test Command Mode commands (A-F)")
-        print("5. Test Gags Mode commands (A-F)")
-        print("6. Test specific command by name")
-        print("7. List all commands")
-        print("8. View discovered behaviors")
-        print("9. Exit")
-        print()
+    # Hold the behaviors log open for the whole session; line buffering
+    # gets each entry to disk promptly without reopening the file
+    with open(BEHAVIORS_FILE, "a", buffering=1) as behaviors_fh:
+        while True:
+            print(INTERACTIVE_MENU)
 
-        choice = input("Choose option (1-9): ").strip()
-
-        if choice == "1":
-            test_command(squawkers, "dance")
-        elif choice == "2":
-            test_command(squawkers, "reset")
-        elif choice == "3":
-            print("\nResponse Mode buttons:")
-            for letter in "ABCDEF":
-                print(f"  {letter}: response_{letter.lower()}")
-            button = input("Which button? (A-F): ").strip().upper()
-            if button in "ABCDEF":
-                test_command(squawkers, f"response_{button.lower()}")
-        elif choice == "4":
-            print("\nCommand Mode buttons:")
-            for letter in "ABCDEF":
-                print(f"  {letter}: command_{letter.lower()}")
-            button = input("Which button? (A-F): ").strip().upper()
-            if button in "ABCDEF":
-                test_command(squawkers, f"command_{button.lower()}")
-        elif choice == "5":
-            print("\nGags Mode buttons:")
-            for letter in "ABCDEF":
-                print(f"  {letter}: gags_{letter.lower()}")
-            button = input("Which button? (A-F): ").strip().upper()
-            if button in "ABCDEF":
-                test_command(squawkers, f"gags_{button.lower()}")
-        elif choice == "6":
-            cmd = input("Command name: ").strip()
-            if cmd in IR_CODES:
-                test_command(squawkers, cmd)
-            else:
-                print(f"❌ Unknown command: {cmd}")
-                print(f"Available: {', '.join(IR_CODES.keys())}")
-        elif choice == "7":
-            squawkers.print_all_codes()
-        elif choice == "8":
-            view_behaviors()
-        elif choice == "9":
-            print("\n👋 Goodbye!")
-            break
-        else:
-            print("❌ Invalid choice")
+            choice = input("Choose option (1-9): ").strip()
+
+            if choice == "9":
+                print("\n👋 Goodbye!")
+                break
+
+            handler = MENU_HANDLERS.get(choice)
+            if handler is None:
+                print("❌ Invalid choice")
+                continue
+
+            handler(squawkers, behaviors_fh)
 
 
 def view_behaviors():
     """View discovered behaviors"""
-    behaviors_file = Path(__file__).parent / "discovered_behaviors.txt"
-
-    if not behaviors_file.exists():
+    # interactive_test creates the file up front, so an empty one means none yet
+    if not BEHAVIORS_FILE.exists() or BEHAVIORS_FILE.stat().st_size == 0:
         print("\n📝 No behaviors documented yet")
         return
 
-    print("\n" + "="*70)
+    print(HDR)
     print("DISCOVERED BEHAVIORS")
-    print("="*70)
+    print(SEP)
 
-    with open(behaviors_file, "r") as f:
-        print(f.read())
+    # Stream line by line so memory stays flat as the log grows
+    with open(BEHAVIORS_FILE, "r") as f:
+        sys.stdout.writelines(f)
+    print()
 
 
 def main():
@@ -259,7 +274,7 @@ def main():
         exit(1)
 
     print("🦜 Squawkers McGraw IR Testing Tool")
-    print("="*70)
+    print(SEP)
     print(f"Home Assistant: {HA_URL}")
     print(f"Broadlink Entity: remote.office_lights")
     print()
@@ -0,0 +1,72 @@
+"""
+Audio device lookup shared by the Saga examples
+
+Finding the EMEET mic or speaker means walking every device PortAudio knows
+about. The index found is remembered in ~/.cache/saga/audio_devices.json, and
+later runs only re-check that one device by name before trusting it.
+"""
+
+import functools
+import json
+from pathlib import Path
+
+import sounddevice as sd
+
+DEVICE_CACHE_FILE = Path.home() / ".cache" / "saga" / "audio_devices.json"
+
+
+def _cached_device(key):
+    """Return the {name, index, hostapi} entry stored under key, or None."""
+    try:
+        return json.loads(DEVICE_CACHE_FILE.read_text())[key]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _remember_device(key, index, device):
+    """Store a device under key; a read-only cache dir just means rescanning next run."""
+    try:
+        cache = json.loads(DEVICE_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    cache[key] = {"name": device['name'], "index": index, "hostapi": device['hostapi']}
+
+    try:
+        DEVICE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DEVICE_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+    except OSError:
+        pass
+
+
+def _find_emeet(key, channels_field):
+    """Index of the EMEET device with channels_field > 0, using the cached index when it still fits."""
+    cached = _cached_device(key)
+    if cached is not None:
+        try:
+            device = sd.query_devices(cached['index'])
+            if (device['name'] == cached['name']
+                    and device['hostapi'] == cached['hostapi']
+                    and device[channels_field] > 0):
+                return cached['index']
+        except (sd.PortAudioError, KeyError, TypeError, ValueError):
+            pass  # Device list changed since last run; rescan
+
+    devices = sd.query_devices()
+    for idx, device in enumerate(devices):
+        if "EMEET" in device['name'] and device[channels_field] > 0:
+            _remember_device(key, idx, device)
+            return idx
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def find_emeet_input():
+    """Find EMEET input device for recording (None if it isn't connected)."""
+    return _find_emeet("emeet_input", "max_input_channels")
+
+
+@functools.lru_cache(maxsize=None)
+def find_emeet_output():
+    """Find EMEET output device for playback (None if it isn't connected)."""
+    return _find_emeet("emeet_output", "max_output_channels")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Long-lived model server for the Saga examples
+
+Every study run otherwise pays seconds of Whisper and Piper loading before
+Saga says a word. Start this once and leave it running: the example scripts
+find it and borrow its already-loaded models, and load their own when it
+isn't up.
+
+Usage:
+    python _model_service.py --voice en_GB-semaine-medium --stt base --stt tiny.en
+
+Models named on the command line are loaded up front; anything else a script
+asks for is loaded on first use and kept.
+"""
+
+import os
+import argparse
+import threading
+from collections import namedtuple
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+from faster_whisper import BatchedInferencePipeline
+
+from _models import STT_THREADS, get_stt, get_tts
+
+# Socket lives in the user's own cache dir, and is itself only accessible to
+# the user: requests are unpickled, so other accounts mustn't reach it
+SERVICE_DIR = Path.home() / ".cache" / "saga"
+SERVICE_ADDRESS = str(SERVICE_DIR / "models.sock")
+
+# Stand-ins for faster-whisper's Segment, Piper's AudioChunk and voice
+# config, carrying only the fields the examples read
+Segment = namedtuple("Segment", ["start", "end", "text"])
+AudioChunk = namedtuple("AudioChunk", ["audio_int16_array"])
+VoiceConfig = namedtuple("VoiceConfig", ["sample_rate"])
+
+# Two clients asking for the same cold model shouldn't load it twice
+LOAD_LOCK = threading.Lock()
+BATCHED_STT = {}
+
+
+def _receive(conn):
+    """Receive one reply, re-raising any exception the service sent back."""
+    reply = conn.recv()
+    if isinstance(reply, Exception):
+        raise reply
+    return reply
+
+
+class RemoteWhisper:
+    """
+    WhisperModel stand-in whose transcribe() runs in the service.
+
+    With batched=True it stands in for a BatchedInferencePipeline instead.
+    """
+
+    def __init__(self, name, batched=False):
+        self.name = name
+        self.batched = batched
+        self.conn = Client(SERVICE_ADDRESS)
+
+    def transcribe(self, audio, **kwargs):
+        """Transcribe like the real thing; segments carry start, end and text."""
+        self.conn.send(("transcribe", (self.name, self.batched), audio, kwargs))
+        return [Segment(*seg) for seg in _receive(self.conn)], None
+
+
+class RemoteVoice:
+    """PiperVoice stand-in whose synthesize() runs in the service."""
+
+    def __init__(self, voice):
+        self.voice = voice
+        self.conn = Client(SERVICE_ADDRESS)
+        self.conn.send(("voice_info", voice))
+        sample_rate, model_file = _receive(self.conn)
+        self.config = VoiceConfig(sample_rate)
+        self.model_file = Path(model_file)
+
+    def synthesize(self, text):
+        """
+        Yield audio chunks as the service synthesizes them.
+
+        Exhaust the generator before the next call; the connection carries
+        one reply stream at a time.
+        """
+        self.conn.send(("synthesize", self.voice, text))
+        while True:
+            audio = _receive(self.conn)
+            if audio is None:
+                return
+            yield AudioChunk(audio)
+
+
+def connect_models(voice, stt_name):
+    """
+    Borrow a voice and a Whisper model from a running service.
+
+    Each stand-in has its own connection, so STT on a worker thread and TTS
+    on the main thread don't queue behind each other.
+
+    Returns:
+        (voice, stt_model) stand-ins, or None if no service is running
+
+    Raises:
+        FileNotFoundError: If the service can't find the Piper voice
+    """
+    if not os.path.exists(SERVICE_ADDRESS):
+        return None
+
+    try:
+        return RemoteVoice(voice), RemoteWhisper(stt_name)
+    except ConnectionRefusedError:
+        # Socket left behind by a service that's no longer running
+        return None
+
+
+def batched_pipeline(stt_model):
+    """Batched pipeline over stt_model, run wherever stt_model runs."""
+    if isinstance(stt_model, RemoteWhisper):
+        return RemoteWhisper(stt_model.name, batched=True)
+    return BatchedInferencePipeline(stt_model)
+
+
+def load_stt(name, batched=False):
+    """Cached Whisper model (or batched pipeline), loaded on first request."""
+    with LOAD_LOCK:
+        stt_model = get_stt(name, cpu_threads=STT_THREADS)
+        if not batched:
+            return stt_model
+        if name not in BATCHED_STT:
+            BATCHED_STT[name] = BatchedInferencePipeline(stt_model)
+        return BATCHED_STT[name]
+
+
+def load_tts(voice):
+    """Cached Piper voice, loaded on first request."""
+    with LOAD_LOCK:
+        return get_tts(voice)
+
+
+def serve(conn):
+    """Answer one client's requests until it disconnects."""
+    with conn:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                return
+
+            try:
+                kind = request[0]
+                if kind == "transcribe":
+                    _, (name, batched), audio, kwargs = request
+                    segments, _ = load_stt(name, batched).transcribe(audio, **kwargs)
+                    conn.send([(seg.start, seg.end, seg.text) for seg in segments])
+                elif kind == "voice_info":
+                    tts_voice = load_tts(request[1])
+                    conn.send((tts_voice.config.sample_rate, str(tts_voice.model_file)))
+                elif kind == "synthesize":
+                    _, voice, text = request
+                    for chunk in load_tts(voice).synthesize(text):
+                        conn.send(chunk.audio_int16_array)
+                    conn.send(None)
+                else:
+                    raise ValueError(f"Unknown request: {kind!r}")
+            except Exception as e:
+                conn.send(e)
+
+
+def main():
+    """Load the requested models and serve them until interrupted."""
+    parser = argparse.ArgumentParser(description="Keep Saga's models loaded between runs")
+    parser.add_argument("--voice", action="append", default=[],
+                       help="Piper voice to preload (repeatable)")
+    parser.add_argument("--stt", action="append", default=[],
+                       help="Whisper model to preload (repeatable)")
+    args = parser.parse_args()
+
+    SERVICE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    if os.path.exists(SERVICE_ADDRESS):
+        try:
+            Client(SERVICE_ADDRESS).close()
+            print(f"❌ Model service already running at {SERVICE_ADDRESS}")
+            return 1
+        except ConnectionRefusedError:
+            os.unlink(SERVICE_ADDRESS)
+
+    for voice in args.voice:
+        print(f"🔊 Loading voice {voice}...")
+        load_tts(voice)
+
+    for name in args.stt:
+        print(f"👂 Loading Whisper {name}...")
+        load_stt(name)
+
+    # Create the socket owner-only from the start; the cache dir may already
+    # exist with the usual 0755, which mkdir(mode=...) doesn't change
+    old_umask = os.umask(0o177)
+    try:
+        listener = Listener(SERVICE_ADDRESS, family="AF_UNIX")
+    finally:
+        os.umask(old_umask)
+
+    print(f"✓ Serving models at {SERVICE_ADDRESS} (Ctrl+C to stop)")
+
+    try:
+        while True:
+            conn = listener.accept()
+            threading.Thread(target=serve, args=(conn,), daemon=True).start()
+    except KeyboardInterrupt:
+        print("\n👋 Model service stopped")
+    finally:
+        listener.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+"""
+Shared model loading for the Saga examples
+
+Piper voices and Whisper models take seconds to load, so each one is loaded
+once per process and cached. Repeated runs from a REPL or an orchestrating
+script reuse the weights that are already in memory.
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import Optional
+
+import ctranslate2
+import numpy as np
+import onnxruntime as ort
+from piper import PiperVoice
+from faster_whisper import WhisperModel
+
+PIPER_VOICES_DIR = Path.home() / ".local" / "share" / "piper" / "voices"
+
+# Whisper's CPU threads for the examples: one per core, up to 8
+STT_THREADS = min(8, os.cpu_count() or 1)
+
+
+@functools.lru_cache(maxsize=None)
+def get_tts(voice: str, threads: Optional[int] = None) -> PiperVoice:
+    """
+    Load a Piper voice by name from PIPER_VOICES_DIR.
+
+    Uses the voice's INT8 copy made by quantize_piper.py when there is one.
+    The returned voice's model_file is the .onnx file actually loaded.
+
+    Args:
+        voice: Voice name, e.g. "en_GB-semaine-medium"
+        threads: Cap ONNX Runtime's intra-op threads (default: one per core)
+
+    Raises:
+        FileNotFoundError: If the voice hasn't been downloaded
+    """
+    model_file = PIPER_VOICES_DIR / f"{voice}.int8.onnx"
+    if not model_file.exists():
+        model_file = PIPER_VOICES_DIR / f"{voice}.onnx"
+    config_file = PIPER_VOICES_DIR / f"{voice}.onnx.json"
+
+    if not (model_file.exists() and config_file.exists()):
+        raise FileNotFoundError(f"Piper voice '{voice}' not found in {PIPER_VOICES_DIR}")
+
+    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
+
+    if threads is not None:
+        # Piper doesn't expose session options, so swap in a right-sized session
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        tts_voice.session = ort.InferenceSession(
+            str(model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+
+    tts_voice.model_file = model_file
+    return tts_voice
+
+
+@functools.lru_cache(maxsize=None)
+def get_stt(name: str, cpu_threads: int = 0, num_workers: int = 1) -> WhisperModel:
+    """
+    Load a faster-whisper model for int8 inference, and warm it up.
+
+    Runs on the GPU (int8 weights, float16 activations) when CTranslate2
+    can see one, otherwise on the CPU.
+
+    Args:
+        name: Whisper model size or path, e.g. "tiny.en"
+        cpu_threads: CTranslate2 threads on the CPU (0 = library default)
+        num_workers: Concurrent transcriptions the model can serve
+    """
+    if ctranslate2.get_cuda_device_count() > 0:
+        stt_model = WhisperModel(
+            name,
+            device="cuda",
+            compute_type="int8_float16",
+            num_workers=num_workers
+        )
+    else:
+        stt_model = WhisperModel(
+            name,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=cpu_threads,
+            num_workers=num_workers
+        )
+
+    # First transcription pays CTranslate2's one-off setup; do it on a second
+    # of silence now rather than on the first real recording
+    list(stt_model.transcribe(np.zeros(16000, dtype=np.float32), language="en")[0])
+
+    return stt_model
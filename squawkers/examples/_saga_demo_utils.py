@@ -0,0 +1,215 @@
+"""
+Helpers shared by the Saga vs Squawkers voice demos
+
+The argument, simple voice and therapist demos load Saga's voice, speak her
+lines and trigger Squawkers the same way; they all do it through here. The
+longer studies and the interview speak through saga_speaks too.
+
+Scripted shows are lists of beats: ("saga", line, pause),
+("squawkers", action, description, pause) or ("act", title).
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import sounddevice as sd
+
+from _models import get_tts
+from _tts_cache import stream_synthesize
+
+# British voice (same as Saga)
+SAGA_VOICE = "en_GB-semaine-medium"
+
+
+def load_voice(voice=SAGA_VOICE, threads=None):
+    """
+    Load a Piper voice (cached per process) and warm it up.
+
+    threads caps ONNX Runtime's intra-op pool (see _models.get_tts).
+
+    Raises:
+        FileNotFoundError: If the voice hasn't been downloaded
+    """
+    tts_voice = get_tts(voice, threads)
+
+    # First synthesis pays ONNX Runtime's one-off setup; get it over with now
+    for _ in tts_voice.synthesize("Hello."):
+        pass
+
+    return tts_voice
+
+
+def open_speaker(tts_voice, output_device):
+    """
+    Open and start one output stream for a whole show, fed by saga_speaks.
+
+    Close it when the show is over.
+    """
+    speaker = sd.OutputStream(
+        samplerate=tts_voice.config.sample_rate,
+        channels=1,
+        dtype='int16',
+        device=output_device,
+        blocksize=0
+    )
+    speaker.start()
+    return speaker
+
+
+def saga_speaks(tts_voice, speaker, text, pause=0.3, voice=SAGA_VOICE, cache=True, name="Saga",
+                rendered=None):
+    """
+    Saga speaks via TTS, then pauses.
+
+    Audio plays as it's synthesized. Lines come from the disk cache; pass
+    cache=False for one-off lines (e.g. built from a transcript) that will
+    never be said again. Scripts that render lines ahead of time pass their
+    dict of them as rendered, and those lines play straight from it.
+
+    Args:
+        tts_voice: Loaded PiperVoice
+        speaker: Stream from open_speaker()
+        text: Text to speak
+        pause: Seconds to pause after speaking
+        voice: Voice name tts_voice was loaded from (the disk cache key)
+        cache: Read and write the disk cache
+        name: Who she is in this demo, for the printed line
+        rendered: Optional {text: int16 array, or Future of one}
+    """
+    # stdout stays line-buffered: the line has to be on screen while she
+    # says it, and the flush is nothing next to the audio and pauses
+    print(f"\n🤖 {name}: \"{text}\"")
+
+    pending = rendered.get(text) if rendered is not None else None
+    if pending is not None:
+        # A Future has usually finished already, while earlier lines played
+        audio_chunks = [pending.result() if isinstance(pending, Future) else pending]
+    elif cache:
+        audio_chunks = stream_synthesize(tts_voice, voice, text)
+    else:
+        audio_chunks = (chunk.audio_int16_array for chunk in tts_voice.synthesize(text))
+
+    for audio in audio_chunks:
+        speaker.write(audio)
+
+    # Writes only block until audio is queued, so push one output latency of
+    # silence through to make sure the tail has actually been played
+    speaker.write(np.zeros(int(speaker.latency * speaker.samplerate), dtype=np.int16))
+
+    time.sleep(pause)
+
+
+def squawkers_actions(squawkers):
+    """Resolve Squawkers' button, gag and dance methods once, by name."""
+    actions = {
+        name: getattr(squawkers, name)
+        for prefix in ('button', 'gag')
+        for name in (f'{prefix}_{letter}' for letter in 'abcdef')
+    }
+    actions['dance'] = squawkers.dance
+    return actions
+
+
+def warm_up_remote(squawkers):
+    """
+    Fetch Squawkers' IR remote state from Home Assistant once, before the show.
+
+    Connecting to Home Assistant then happens during setup rather than on the
+    first squawk, and a missing remote or unreachable server shows up before
+    the curtain rises.
+    """
+    squawkers.client.get_state(squawkers.entity_id)
+
+
+def squawkers_responds(actions, action_name, description, pause=3.0):
+    """
+    Squawkers responds with an IR command (looked up in the actions table).
+
+    The pause runs from when the command is sent, so the Home Assistant
+    round trip comes out of it rather than being added on top.
+    """
+    print(f"\n🦜 Squawkers: *{description}*")
+    deadline = time.monotonic() + pause
+    actions[action_name]()
+    time.sleep(max(0.0, deadline - time.monotonic()))
+
+
+def bake_show(tts_voice, beats, voice=SAGA_VOICE):
+    """
+    Lay a scripted show out as one track: Saga's lines with each pause as silence.
+
+    Lines come from the disk cache (and are rendered into it if missing), so
+    nothing is synthesized while the show plays.
+
+    Returns:
+        (track, cues): The int16 track, and (seconds into the track, beat)
+        for every beat
+    """
+    sample_rate = tts_voice.config.sample_rate
+    pieces = []
+    cues = []
+    samples = 0
+
+    for beat in beats:
+        cues.append((samples / sample_rate, beat))
+        kind, *rest = beat
+        if kind == "act":
+            continue
+        if kind == "saga":
+            for audio in stream_synthesize(tts_voice, voice, rest[0]):
+                pieces.append(audio)
+                samples += len(audio)
+        silence = int(rest[-1] * sample_rate)
+        pieces.append(np.zeros(silence, dtype=np.int16))
+        samples += silence
+
+    return np.concatenate(pieces), cues
+
+
+def _cue(actions, beats):
+    """Print beats as they play and, for Squawkers, send his IR command."""
+    for kind, *rest in beats:
+        if kind == "act":
+            print(f"\n--- {rest[0]} ---")
+        elif kind == "saga":
+            print(f"\n🤖 Saga: \"{rest[0]}\"")
+        else:
+            action_name, description, _ = rest
+            print(f"\n🦜 Squawkers: *{description}*")
+            actions[action_name]()
+
+
+def play_show(speaker, track, cues, actions):
+    """
+    Play a baked show, with a timer per beat printing it and triggering Squawkers.
+
+    Squawkers' commands go out on their timers, so the Home Assistant round
+    trip never holds up the audio.
+    """
+    sample_rate = int(speaker.samplerate)
+
+    # The first sample reaches the speaker one output latency after it's
+    # written. Beats at the same moment (an act title and its first line)
+    # share a timer so they print in order.
+    timers = [
+        threading.Timer(speaker.latency + offset, _cue, (actions, [beat for _, beat in group]))
+        for offset, group in itertools.groupby(cues, key=lambda cue: cue[0])
+    ]
+    for timer in timers:
+        timer.start()
+
+    try:
+        # A second at a time, so Ctrl+C isn't stuck behind one long write
+        for start in range(0, len(track), sample_rate):
+            speaker.write(track[start:start + sample_rate])
+        speaker.write(np.zeros(int(speaker.latency * sample_rate), dtype=np.int16))
+    except BaseException:
+        for timer in timers:
+            timer.cancel()
+        raise
+
+    for timer in timers:
+        timer.join()
@@ -0,0 +1,119 @@
+"""
+On-disk cache of Saga's synthesized lines
+
+The voice demos speak the same scripted lines on every run. Each line is
+synthesized once, saved as raw int16 PCM in a file keyed by voice, model
+file, sample rate and text, and memory-mapped straight from disk on later
+runs instead of going through Piper again.
+
+Scripts that keep whole lines in memory instead render them with render().
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+TTS_CACHE_DIR = Path.home() / ".cache" / "saga" / "tts"
+
+
+def _model_stamp(tts_voice):
+    """The model file tts_voice was loaded from and its mtime, if it's known."""
+    model_file = getattr(tts_voice, "model_file", None)
+    if model_file is None:
+        return ""
+    try:
+        return f"{model_file}@{os.stat(model_file).st_mtime_ns}"
+    except OSError:
+        return str(model_file)
+
+
+def _cache_path(tts_voice, voice, text, cache_dir):
+    """Where the rendered line lives, keyed by voice, model file, sample rate and text."""
+    sample_rate = tts_voice.config.sample_rate
+    model = _model_stamp(tts_voice)
+    key = hashlib.sha1(f"{voice}|{model}|{sample_rate}|{text}".encode()).hexdigest()
+    return Path(cache_dir) / f"{key}.pcm"
+
+
+def _open_temp(path):
+    """Temp file next to path to render into, or None if the cache can't be written."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False)
+    except OSError:
+        return None
+
+
+def _discard(tmp):
+    """Drop a half-written render."""
+    tmp.close()
+    try:
+        os.unlink(tmp.name)
+    except OSError:
+        pass
+
+
+def stream_synthesize(tts_voice, voice, text, cache_dir=TTS_CACHE_DIR):
+    """
+    Yield Piper audio for text as int16 arrays, ready to write to a stream.
+
+    A cached line comes back as one memory-mapped array. Otherwise Piper's
+    chunks are yielded as they're synthesized, so playback can start on the
+    first one, and each is appended to the cache file as it goes by.
+
+    Args:
+        tts_voice: PiperVoice from _models.get_tts (its model_file is part
+            of the cache key, so re-quantizing the voice re-renders its lines)
+        voice: Voice name tts_voice was loaded from, e.g. "en_GB-semaine-medium"
+        text: Line to speak
+        cache_dir: Where rendered lines are kept
+    """
+    path = _cache_path(tts_voice, voice, text, cache_dir)
+
+    try:
+        audio_array = np.memmap(path, dtype=np.int16, mode="r")
+    except (OSError, ValueError):
+        audio_array = None  # Not rendered yet; render it below
+
+    if audio_array is not None:
+        yield audio_array
+        return
+
+    # Chunks go to a temp file that's renamed into place once the line is
+    # complete, so an interrupted line never lands in the cache
+    tmp = _open_temp(path)
+    try:
+        for chunk in tts_voice.synthesize(text):
+            audio = chunk.audio_int16_array
+            if tmp is not None:
+                try:
+                    tmp.write(audio)
+                except OSError:
+                    _discard(tmp)
+                    tmp = None
+            yield audio
+
+        if tmp is not None:
+            tmp.close()
+            if os.path.getsize(tmp.name):
+                os.replace(tmp.name, path)
+                tmp = None
+    finally:
+        if tmp is not None:
+            _discard(tmp)
+
+
+def render(tts_voice, text):
+    """Synthesize a whole line into one int16 array (no disk cache)."""
+    audio_chunks = [chunk.audio_int16_array for chunk in tts_voice.synthesize(text)]
+    return np.concatenate(audio_chunks) if audio_chunks else np.zeros(0, dtype=np.int16)
+
+
+def prerender(tts_voice, voice, lines, cache_dir=TTS_CACHE_DIR):
+    """Render any of lines not yet in the disk cache, so they play straight from it."""
+    for text in lines:
+        for _ in stream_synthesize(tts_voice, voice, text, cache_dir):
+            pass
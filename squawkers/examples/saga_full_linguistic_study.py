@@ -16,61 +16,208 @@ She will:
 This is going to be hilarious.
 """
 
+import os
+import queue
+import re
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Whisper (CTranslate2), Piper (ONNX Runtime) and numpy's BLAS each default to
+# a thread per core, and oversubscribe the CPU once STT and TTS overlap. Whisper
+# and Piper get explicit counts (STT_THREADS/TTS_THREADS below); the OpenMP/BLAS
+# pools only read these when the libraries load, so set them first.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
 import numpy as np
+import onnxruntime as ort
 import sounddevice as sd
 import webrtcvad
-from pathlib import Path
-from collections import Counter, deque
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from squawkers.squawkers_full import SquawkersFull
 from saga_assistant.ha_client import HomeAssistantClient
-from piper import PiperVoice
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline
+from _models import get_stt, get_tts
+from _audio_devices import find_emeet_input
+from _saga_demo_utils import open_speaker, saga_speaks
+from _tts_cache import render
 
 # Configuration
 TTS_VOICE = "en_GB-semaine-medium"
-STT_MODEL = "base"  # Perfect for hilarious mishearings!
+STT_MODEL = "tiny.en"  # English-only and fast; still plenty of hilarious mishearings!
+STT_THREADS = 4  # Whisper and Piper split the cores between them
+TTS_THREADS = 2
 
 # VAD Configuration (from run_assistant.py)
 SAMPLE_RATE = 16000
-VAD_MODE = 2  # Aggressiveness: 0-3
-VAD_FRAME_MS = 30  # Frame duration: 10, 20, or 30ms
+VAD_MODE = 2  # webrtcvad aggressiveness: 0-3
+
+# Silero VAD (ONNX model from the snakers4/silero-vad repo) false-triggers on
+# room noise far less than webrtcvad, so an utterance can end after a much
+# shorter silence. webrtcvad is used when the model hasn't been downloaded.
+SILERO_VAD_MODEL = Path(os.getenv(
+    "SILERO_VAD_MODEL",
+    Path.home() / ".local" / "share" / "silero" / "silero_vad.onnx"
+))
+SILERO_VAD_THRESHOLD = 0.5  # Speech probability
+USE_SILERO_VAD = SILERO_VAD_MODEL.exists()
+
+if USE_SILERO_VAD:
+    VAD_FRAME_MS = 32  # Silero scores fixed 512-sample windows at 16kHz
+    MIN_SILENCE_CHUNKS = 10  # Silence chunks to stop (~320ms)
+else:
+    VAD_FRAME_MS = 30  # Frame duration: 10, 20, or 30ms
+    MIN_SILENCE_CHUNKS = 23  # Silence chunks to stop (~700ms)
+
+VAD_FRAME_SIZE = int(SAMPLE_RATE * VAD_FRAME_MS / 1000)
 MIN_SPEECH_CHUNKS = 2  # Min chunks to start recording
-MIN_SILENCE_CHUNKS = 23  # Silence chunks to stop (~700ms)
 MAX_RECORDING_DURATION_S = 10  # Maximum duration
 
-
-def find_emeet_input():
-    """Find EMEET input device for recording."""
-    devices = sd.query_devices()
-    for idx, device in enumerate(devices):
-        if "EMEET" in device['name'] and device['max_input_channels'] > 0:
-            return idx
-    return None
-
-
-def saga_speaks(tts_voice, output_device, text):
-    """Saga speaks via TTS."""
-    print(f"\n🤖 Dr. Saga: \"{text}\"")
-
-    audio_chunks = []
-    for audio_chunk in tts_voice.synthesize(text):
-        audio_chunks.append(audio_chunk.audio_int16_array)
-
-    if audio_chunks:
-        audio_array = np.concatenate(audio_chunks)
-        sd.play(audio_array, samplerate=tts_voice.config.sample_rate, device=output_device)
-        sd.wait()
-
-    time.sleep(0.3)
-
-
-def test_response(squawkers, stt_model, vad, input_dev, method_name, label, test_num, reset_after=False):
-    """Test a response and record what we hear using VAD."""
+# Below these a clip is treated as silence and never reaches Whisper
+MIN_TRANSCRIBE_SPEECH_CHUNKS = 4  # Speech frames in the whole recording
+MIN_TRANSCRIBE_DURATION_S = 0.3
+MIN_TRANSCRIBE_RMS = 150  # int16 amplitude
+
+# Longest clip record_response can return: the full window plus pre-speech lead-in
+PRE_SPEECH_CHUNKS = 20  # ~600ms pre-speech
+MAX_SAMPLES = MAX_RECORDING_DURATION_S * SAMPLE_RATE + PRE_SPEECH_CHUNKS * VAD_FRAME_SIZE
+
+# int16 -> [-1, 1) float32 for Whisper, written into one buffer reused every turn
+INT16_TO_FLOAT = np.float32(1 / 32768)
+FLOAT_SCRATCH = np.empty(MAX_SAMPLES, dtype=np.float32)
+
+# Varied responses to avoid monotony
+BUTTON_COMMENTS = [
+    "Fascinating.",
+    "Interesting variation.",
+    "Noted.",
+    "Remarkable.",
+    "Most intriguing."
+]
+
+# Varied responses for gags
+GAG_COMMENTS = [
+    "Curious.",
+    "Quite distinct.",
+    "I see.",
+    "Notable phonetic shift.",
+    "Interesting.",
+    "Significant variation."
+]
+
+# Lines Saga says on every run, synthesized once before the session starts
+CANNED_LINES = (
+    "Recording now. Subject Squawkers, comprehensive linguistic analysis, session one.",
+    "I have obtained access to the subject's complete communication interface.",
+    "I will systematically elicit all available responses to fully document the language system.",
+    "Beginning phase one. Response set alpha.",
+    "Skipping button C temporarily.",
+    "Phase one complete. Proceeding to phase two.",
+    "Beginning phase two. Response set beta.",
+    "Thank you. That's enough for now.",
+    "Phase two complete. Beginning analysis.",
+    "Comprehensive analysis follows.",
+    "Analyzing phonetic patterns.",
+    "Attempting grammatical construction.",
+    "Preliminary conclusions.",
+    "End recording. Report to follow.",
+    *BUTTON_COMMENTS,
+    *GAG_COMMENTS,
+)
+
+# Pre-rendered int16 audio for CANNED_LINES, keyed by text
+TTS_CACHE = {}
+
+# Words for frequency analysis (punctuation and digits dropped)
+WORD_RE = re.compile(r"[a-z']+")
+
+
+class SileroVad:
+    """
+    Streaming Silero VAD on ONNX Runtime with webrtcvad's is_speech() interface.
+
+    The model's recurrent state and 64-sample context carry over between
+    calls, so frames must arrive in order; call reset() between recordings.
+    """
+
+    CONTEXT_SAMPLES = 64
+
+    def __init__(self, model_path, threshold=SILERO_VAD_THRESHOLD):
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.threshold = threshold
+        self.reset()
+
+    def reset(self):
+        """Forget all previous audio."""
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._window = np.zeros((1, self.CONTEXT_SAMPLES + VAD_FRAME_SIZE), dtype=np.float32)
+
+    def is_speech(self, frame_bytes, sample_rate):
+        """Score one int16 frame of VAD_FRAME_SIZE samples."""
+        window = self._window[0]
+        window[:self.CONTEXT_SAMPLES] = window[-self.CONTEXT_SAMPLES:]
+        np.multiply(np.frombuffer(frame_bytes, dtype=np.int16), INT16_TO_FLOAT,
+                    out=window[self.CONTEXT_SAMPLES:])
+
+        prob, self._state = self.session.run(None, {
+            "input": self._window,
+            "state": self._state,
+            "sr": np.array(sample_rate, dtype=np.int64),
+        })
+        return prob.item() >= self.threshold
+
+
+def open_microphone(input_dev):
+    """
+    Open one input stream for the whole session.
+
+    Returns (stream, frames): the PortAudio callback copies each VAD-sized
+    frame into the frames queue, so turns just consume from it instead of
+    paying the device open cost every time.
+    """
+    frames = queue.Queue()
+
+    def on_audio(indata, frame_count, time_info, status):
+        frames.put_nowait(indata.copy())
+
+    stream = sd.InputStream(
+        device=input_dev,
+        channels=1,
+        samplerate=SAMPLE_RATE,
+        dtype='int16',
+        blocksize=VAD_FRAME_SIZE,
+        callback=on_audio
+    )
+    stream.start()
+    return stream, frames
+
+
+def precache_speech(tts_voice, texts):
+    """Synthesize fixed lines once so dr_saga_speaks can play them without Piper."""
+    for text in texts:
+        TTS_CACHE[text] = render(tts_voice, text)
+
+
+def dr_saga_speaks(tts_voice, speaker, text):
+    """Dr. Saga speaks (see _saga_demo_utils.saga_speaks), canned lines from TTS_CACHE."""
+    saga_speaks(tts_voice, speaker, text, cache=False, name="Dr. Saga", rendered=TTS_CACHE)
+
+
+def record_response(squawkers, vad, mic_frames, method, label, test_num, reset_after=False):
+    """Trigger a response and record it using VAD. Returns the int16 audio."""
     print(f"\n{'─' * 60}")
     print(f"TEST {test_num}: {label}")
     print(f"{'─' * 60}")
@@ -78,116 +225,238 @@ def test_response(squawkers, stt_model, vad, input_dev, method_name, label, test
     print(f"🎧 *listening (VAD auto-stop)...*")
 
     # VAD setup
-    vad_frame_size = int(SAMPLE_RATE * VAD_FRAME_MS / 1000)
+    vad_frame_size = VAD_FRAME_SIZE
     speech_chunk_count = 0
     silence_chunk_count = 0
+    total_speech_chunks = 0
     is_recording = False
-    audio_buffer = []
-    pre_speech_buffer = deque(maxlen=20)  # ~600ms pre-speech
+
+    # Pre-speech lead-in kept as a fixed ring of frames; once it has wrapped,
+    # the oldest frame sits at ring_idx
+    ring = np.empty((PRE_SPEECH_CHUNKS, vad_frame_size), dtype=np.int16)
+    ring_idx = 0
+    ring_full = False
 
     max_chunks = int(MAX_RECORDING_DURATION_S * 1000 / VAD_FRAME_MS)
+
+    # Recording goes straight into one preallocated buffer instead of a list
+    # of per-frame arrays that has to be concatenated at the end
+    audio_buffer = np.empty(MAX_SAMPLES, dtype=np.int16)
+    wpos = 0
+
     chunk_count = 0
-    triggered = False
+    trigger = None
 
-    try:
-        with sd.InputStream(
-            device=input_dev,
-            channels=1,
-            samplerate=SAMPLE_RATE,
-            dtype='int16',
-            blocksize=vad_frame_size
-        ) as stream:
-
-            while chunk_count < max_chunks:
-                # Read audio chunk
-                audio_chunk, _ = stream.read(vad_frame_size)
-                audio_chunk = audio_chunk.flatten()
-                chunk_count += 1
-
-                # Trigger Squawkers after a few chunks
-                if not triggered and chunk_count == 2:
-                    method = getattr(squawkers, method_name)
-                    method()
-                    triggered = True
-
-                # Check for speech
-                audio_bytes = audio_chunk.tobytes()
-                try:
-                    is_speech = vad.is_speech(audio_bytes, SAMPLE_RATE)
-                except:
-                    is_speech = False
-
-                if is_speech:
-                    speech_chunk_count += 1
-                    silence_chunk_count = 0
-
-                    if not is_recording:
-                        if speech_chunk_count >= MIN_SPEECH_CHUNKS:
-                            print("   🔴 Speech detected")
-                            is_recording = True
-                            audio_buffer.extend(pre_speech_buffer)
-                            audio_buffer.append(audio_chunk)
-                    else:
-                        audio_buffer.append(audio_chunk)
-                else:
-                    silence_chunk_count += 1
-                    speech_chunk_count = 0
+    # Drop whatever the mic picked up between turns (mostly Saga talking)
+    while not mic_frames.empty():
+        mic_frames.get_nowait()
 
-                    if is_recording:
-                        audio_buffer.append(audio_chunk)
+    if isinstance(vad, SileroVad):
+        vad.reset()
 
-                        if silence_chunk_count >= MIN_SILENCE_CHUNKS:
-                            print(f"   ⏹️  Recording complete")
-                            break
-                    else:
-                        pre_speech_buffer.append(audio_chunk)
+    try:
+        while chunk_count < max_chunks:
+            # Next frame from the microphone callback
+            audio_chunk = mic_frames.get(timeout=1.0)
+            audio_chunk = audio_chunk[:, 0]  # Mono view, no copy
+            chunk_count += 1
+
+            # Trigger Squawkers after a few chunks. The HA call runs on its
+            # own thread so a slow request can't hold up VAD on the frames
+            # piling up in the queue.
+            if trigger is None and chunk_count == 2:
+                trigger = threading.Thread(target=method, daemon=True)
+                trigger.start()
+
+            # Check for speech
+            audio_bytes = audio_chunk.tobytes()
+            try:
+                is_speech = vad.is_speech(audio_bytes, SAMPLE_RATE)
+            except:
+                is_speech = False
+
+            if is_speech:
+                speech_chunk_count += 1
+                total_speech_chunks += 1
+                silence_chunk_count = 0
+
+                if not is_recording:
+                    if speech_chunk_count >= MIN_SPEECH_CHUNKS:
+                        print("   🔴 Speech detected")
+                        is_recording = True
+                        lead_in = (ring[ring_idx:], ring[:ring_idx]) if ring_full else (ring[:ring_idx],)
+                        for block in lead_in:
+                            audio_buffer[wpos:wpos + block.size] = block.reshape(-1)
+                            wpos += block.size
+                        audio_buffer[wpos:wpos + vad_frame_size] = audio_chunk
+                        wpos += vad_frame_size
+                else:
+                    audio_buffer[wpos:wpos + vad_frame_size] = audio_chunk
+                    wpos += vad_frame_size
+            else:
+                silence_chunk_count += 1
+                speech_chunk_count = 0
+
+                if is_recording:
+                    audio_buffer[wpos:wpos + vad_frame_size] = audio_chunk
+                    wpos += vad_frame_size
+
+                    if silence_chunk_count >= MIN_SILENCE_CHUNKS:
+                        print(f"   ⏹️  Recording complete")
+                        break
+                else:
+                    ring[ring_idx] = audio_chunk
+                    ring_idx = (ring_idx + 1) % PRE_SPEECH_CHUNKS
+                    ring_full = ring_full or ring_idx == 0
 
     except Exception as e:
         print(f"   ❌ Recording error: {e}")
 
-    # Convert to numpy array
-    if audio_buffer:
-        audio_np = np.concatenate(audio_buffer)
+    if trigger is not None:
+        trigger.join()
+
+    # Trim to what was recorded (a view, no copy)
+    if wpos and total_speech_chunks < MIN_TRANSCRIBE_SPEECH_CHUNKS:
+        print("   ⚠️  Too little speech to transcribe")
+        audio_np = np.array([], dtype=np.int16)
+    elif wpos:
+        audio_np = audio_buffer[:wpos]
     else:
         print("   ⚠️  No audio recorded")
         audio_np = np.array([], dtype=np.int16)
 
-    # Transcribe
-    if len(audio_np) > 0:
-        audio_float = audio_np.astype(np.float32) / 32768.0
-        segments, _ = stt_model.transcribe(audio_float, language="en")
-        heard = " ".join([seg.text.strip() for seg in segments]).strip()
-    else:
-        heard = ""
-
-    if heard:
-        print(f"📝 Subject said: \"{heard}\"")
-    else:
-        print(f"📝 Subject said: [unintelligible vocalisation]")
-
     # If this triggers dance, reset afterwards
     if reset_after:
         time.sleep(1.0)
         squawkers.reset()
         print("🛑 Dance interrupted with RESET")
 
+    return audio_np
+
+
+def speech_energy(audio_float):
+    """RMS of [-1, 1) float audio, in int16 units like MIN_TRANSCRIBE_RMS."""
+    return np.sqrt(np.dot(audio_float, audio_float) / len(audio_float)) * 32768
+
+
+def transcribe_batch(batched_model, clips):
+    """
+    Transcribe a whole phase of recorded clips in one batched Whisper call.
+
+    The clips worth transcribing are laid end to end and passed as separate
+    clip_timestamps, so the pipeline encodes and decodes them together.
+    Returns one transcript per clip ("" for skipped or silent clips).
+    """
+    heard = [""] * len(clips)
+    audio_float = np.empty(sum(len(clip) for clip in clips), dtype=np.float32)
+    kept = []  # (clip index, start sample, end sample)
+    pos = 0
+
+    for idx, clip in enumerate(clips):
+        n = len(clip)
+        if n < SAMPLE_RATE * MIN_TRANSCRIBE_DURATION_S:
+            continue
+
+        np.multiply(clip, INT16_TO_FLOAT, out=audio_float[pos:pos + n])
+        if speech_energy(audio_float[pos:pos + n]) < MIN_TRANSCRIBE_RMS:
+            continue  # Next clip overwrites this one
+
+        kept.append((idx, pos, pos + n))
+        pos += n
+
+    if not kept:
+        return heard
+
+    segments, _ = batched_model.transcribe(
+        audio_float[:pos],
+        language="en",
+        beam_size=1,
+        without_timestamps=True,
+        clip_timestamps=[{"start": start / SAMPLE_RATE, "end": end / SAMPLE_RATE}
+                         for _, start, end in kept],
+        batch_size=len(kept)
+    )
+
+    # Segments carry times in the joined audio; map each back to its clip
+    clip_starts = np.array([start for _, start, _ in kept]) / SAMPLE_RATE
+    texts = [[] for _ in kept]
+    for seg in segments:
+        slot = int(np.searchsorted(clip_starts, (seg.start + seg.end) / 2, side="right")) - 1
+        texts[slot].append(seg.text.strip())
+
+    for (idx, _, _), parts in zip(kept, texts):
+        heard[idx] = " ".join(parts).strip()
+
+    return heard
+
+
+def report_phase(labels, heard):
+    """Print what the subject said in each test of a batched phase."""
+    for label, text in zip(labels, heard):
+        if text:
+            print(f"📝 {label}: \"{text}\"")
+        else:
+            print(f"📝 {label}: [unintelligible vocalisation]")
+
+
+def warm_up(vad):
+    """Run Silero once on silence so its first-use cost lands before the session."""
+    if isinstance(vad, SileroVad):
+        vad.is_speech(bytes(VAD_FRAME_SIZE * 2), SAMPLE_RATE)
+        vad.reset()
+
+
+def transcribe_response(stt_model, audio_np):
+    """
+    Transcribe a recorded response and report what the subject said.
+
+    Whole clips are decoded once recording ends rather than streamed through
+    sliding windows: every caller overlaps this with Saga speaking, so the
+    decode is already off the critical path, and partial decodes would only
+    compete with Piper for the CPU and hurt accuracy at window seams.
+    """
+    n = len(audio_np)
+    heard = ""
+
+    # Short or near-silent clips would only cost a full Whisper pass to
+    # come back empty
+    if n >= SAMPLE_RATE * MIN_TRANSCRIBE_DURATION_S:
+        # Convert and scale in one pass, straight into the scratch buffer
+        audio_float = FLOAT_SCRATCH[:n]
+        np.multiply(audio_np, INT16_TO_FLOAT, out=audio_float)
+
+        if speech_energy(audio_float) >= MIN_TRANSCRIBE_RMS:
+            # Clips are already VAD-gated and independent, so skip Whisper's
+            # own VAD, cross-segment conditioning, beam search and timestamps
+            segments, _ = stt_model.transcribe(
+                audio_float,
+                language="en",
+                beam_size=1,
+                condition_on_previous_text=False,
+                vad_filter=False,
+                without_timestamps=True
+            )
+            heard = " ".join([seg.text.strip() for seg in segments]).strip()
+
+    if heard:
+        print(f"📝 Subject said: \"{heard}\"")
+    else:
+        print(f"📝 Subject said: [unintelligible vocalisation]")
+
     return heard
 
 
 def analyze_words(responses):
     """Analyze word frequency for 'phonetic patterns'."""
-    all_words = []
+    word_counts = Counter()
     for text in responses.values():
         if text:
-            # Simple word split
-            words = text.lower().replace("!", "").replace("?", "").replace(".", "").split()
-            all_words.extend(words)
+            word_counts.update(WORD_RE.findall(text.lower()))
 
-    if not all_words:
+    if not word_counts:
         return None
 
     # Get most common words
-    word_counts = Counter(all_words)
     return word_counts.most_common(5)
 
 
@@ -207,25 +476,36 @@ def main():
     client = HomeAssistantClient()
     squawkers = SquawkersFull(client)
 
-    # TTS
-    models_dir = Path.home() / ".local" / "share" / "piper" / "voices"
-    model_file = models_dir / f"{TTS_VOICE}.onnx"
-    config_file = models_dir / f"{TTS_VOICE}.onnx.json"
+    # Resolve every trigger method once instead of per turn
+    triggers = {
+        name: getattr(squawkers, name)
+        for prefix in ('button', 'gag')
+        for name in (f'{prefix}_{letter}' for letter in 'abcdef')
+    }
 
-    if not (model_file.exists() and config_file.exists()):
+    # TTS
+    try:
+        tts_voice = get_tts(TTS_VOICE, threads=TTS_THREADS)
+    except FileNotFoundError:
         print(f"❌ TTS voice not found. Run Saga assistant first.")
         return 1
 
-    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
+    print("Rehearsing Saga's lines...")
+    precache_speech(tts_voice, CANNED_LINES)
 
     # STT
     print("Loading speech recognition model...")
-    stt_model = WhisperModel(STT_MODEL, device="cpu", compute_type="int8")
+    stt_model = get_stt(STT_MODEL, cpu_threads=STT_THREADS)
+    batched_stt = BatchedInferencePipeline(model=stt_model)
 
     # VAD
     print("Initializing voice activity detection...")
-    vad = webrtcvad.Vad()
-    vad.set_mode(VAD_MODE)
+    if USE_SILERO_VAD:
+        vad = SileroVad(SILERO_VAD_MODEL)
+    else:
+        print(f"   Silero model not found at {SILERO_VAD_MODEL}, using webrtcvad")
+        vad = webrtcvad.Vad()
+        vad.set_mode(VAD_MODE)
 
     # Audio devices
     input_dev = find_emeet_input()
@@ -234,6 +514,20 @@ def main():
 
     output_dev = sd.default.device[1]
 
+    # One output stream for the whole session, fed chunk-by-chunk by dr_saga_speaks
+    speaker = open_speaker(tts_voice, output_dev)
+
+    # Transcription runs here, overlapping with recording and Saga's speech
+    stt_executor = ThreadPoolExecutor(max_workers=1)
+
+    mic, mic_frames = open_microphone(input_dev)
+
+    # Piper is warm from precaching and Whisper from get_stt, and both audio
+    # streams are open; do the same for the VAD so the first real turn isn't
+    # the slow one
+    print("Calibrating instruments...")
+    warm_up(vad)
+
     print("✓ Equipment ready!\n")
     time.sleep(1)
 
@@ -242,13 +536,13 @@ def main():
     print("SESSION START - COMPREHENSIVE STUDY")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Recording now. Subject Squawkers, comprehensive linguistic analysis, session one.")
+    dr_saga_speaks(tts_voice, speaker, "Recording now. Subject Squawkers, comprehensive linguistic analysis, session one.")
     time.sleep(0.5)
 
-    saga_speaks(tts_voice, output_dev, "I have obtained access to the subject's complete communication interface.")
+    dr_saga_speaks(tts_voice, speaker, "I have obtained access to the subject's complete communication interface.")
     time.sleep(0.5)
 
-    saga_speaks(tts_voice, output_dev, "I will systematically elicit all available responses to fully document the language system.")
+    dr_saga_speaks(tts_voice, speaker, "I will systematically elicit all available responses to fully document the language system.")
     time.sleep(1)
 
     # Store all responses
@@ -260,27 +554,23 @@ def main():
     print("PHASE 1: RESPONSE SET ALPHA (Buttons A-F)")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Beginning phase one. Response set alpha.")
+    dr_saga_speaks(tts_voice, speaker, "Beginning phase one. Response set alpha.")
 
     button_responses = {}
 
-    # Varied responses to avoid monotony
-    button_comments = [
-        "Fascinating.",
-        "Interesting variation.",
-        "Noted.",
-        "Remarkable.",
-        "Most intriguing."
-    ]
+    # Saga's comments are canned, so transcription waits for the end of the
+    # phase and runs as one batch
+    phase_keys, phase_labels, phase_audio = [], [], []
 
     for idx, letter in enumerate(['a', 'b', 'd', 'e', 'f']):  # Skip C for now
-        heard = test_response(squawkers, stt_model, vad, input_dev,
-                            f'button_{letter}',
-                            f'Response Button {letter.upper()}',
-                            test_num)
-        button_responses[f'button_{letter}'] = heard
-        all_responses[f'button_{letter}'] = heard
-        saga_speaks(tts_voice, output_dev, button_comments[idx])
+        audio = record_response(squawkers, vad, mic_frames,
+                                triggers[f'button_{letter}'],
+                                f'Response Button {letter.upper()}',
+                                test_num)
+        phase_keys.append(f'button_{letter}')
+        phase_labels.append(f'Response Button {letter.upper()}')
+        phase_audio.append(audio)
+        dr_saga_speaks(tts_voice, speaker, BUTTON_COMMENTS[idx])
         test_num += 1
 
         if test_num == 3:  # After button B, acknowledge skipping C
@@ -288,60 +578,65 @@ def main():
             print(f"NOTE: Button C")
             print(f"{'─' * 60}")
             print(f"⚠️  SKIPPED FOR NOW - Will revisit if more data needed")
-            saga_speaks(tts_voice, output_dev, "Skipping button C temporarily.")
+            dr_saga_speaks(tts_voice, speaker, "Skipping button C temporarily.")
             test_num += 1
 
+    # Phase one transcribes in the background while phase two runs
+    phase_one = (phase_keys, phase_labels,
+                 stt_executor.submit(transcribe_batch, batched_stt, phase_audio))
+
     time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Phase one complete. Proceeding to phase two.")
+    dr_saga_speaks(tts_voice, speaker, "Phase one complete. Proceeding to phase two.")
 
     # PHASE 2: Gags
     print("\n" + "=" * 70)
     print("PHASE 2: RESPONSE SET BETA (Gags A-F)")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Beginning phase two. Response set beta.")
+    dr_saga_speaks(tts_voice, speaker, "Beginning phase two. Response set beta.")
 
     gag_responses = {}
-
-    # Varied responses for gags
-    gag_comments = [
-        "Curious.",
-        "Quite distinct.",
-        "I see.",
-        "Notable phonetic shift.",
-        "Interesting.",
-        "Significant variation."
-    ]
+    phase_keys, phase_labels, phase_audio = [], [], []
 
     for idx, letter in enumerate(['a', 'b', 'c', 'd', 'e', 'f']):
         # Gag F triggers dance, handle specially
         if letter == 'f':
-            heard = test_response(squawkers, stt_model, vad, input_dev,
-                                f'gag_{letter}',
-                                f'Gag Response {letter.upper()}',
-                                test_num,
-                                reset_after=False)  # Don't auto-reset
-            gag_responses[f'gag_{letter}'] = heard
-            all_responses[f'gag_{letter}'] = heard
+            audio = record_response(squawkers, vad, mic_frames,
+                                    triggers[f'gag_{letter}'],
+                                    f'Gag Response {letter.upper()}',
+                                    test_num,
+                                    reset_after=False)  # Don't auto-reset
             # Saga interrupts the dance (wait longer for dance to start)
             time.sleep(2.0)  # Let dance music start playing
-            saga_speaks(tts_voice, output_dev, "Thank you. That's enough for now.")
+            dr_saga_speaks(tts_voice, speaker, "Thank you. That's enough for now.")
             squawkers.reset()
             print("🛑 Dance interrupted with RESET")
         else:
-            heard = test_response(squawkers, stt_model, vad, input_dev,
-                                f'gag_{letter}',
-                                f'Gag Response {letter.upper()}',
-                                test_num,
-                                reset_after=False)
-            gag_responses[f'gag_{letter}'] = heard
-            all_responses[f'gag_{letter}'] = heard
-            saga_speaks(tts_voice, output_dev, gag_comments[idx])
-
+            audio = record_response(squawkers, vad, mic_frames,
+                                    triggers[f'gag_{letter}'],
+                                    f'Gag Response {letter.upper()}',
+                                    test_num,
+                                    reset_after=False)
+            dr_saga_speaks(tts_voice, speaker, GAG_COMMENTS[idx])
+
+        phase_keys.append(f'gag_{letter}')
+        phase_labels.append(f'Gag Response {letter.upper()}')
+        phase_audio.append(audio)
         test_num += 1
 
+    phase_two = (phase_keys, phase_labels,
+                 stt_executor.submit(transcribe_batch, batched_stt, phase_audio))
+
     time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Phase two complete. Beginning analysis.")
+    dr_saga_speaks(tts_voice, speaker, "Phase two complete. Beginning analysis.")
+
+    print("\n📝 TRANSCRIPTS:")
+    for (keys, labels, pending), responses in ((phase_one, button_responses),
+                                               (phase_two, gag_responses)):
+        heard = pending.result()
+        report_phase(labels, heard)
+        responses.update(zip(keys, heard))
+        all_responses.update(zip(keys, heard))
 
     # ANALYSIS
     print("\n" + "=" * 70)
@@ -349,7 +644,7 @@ def main():
     print("=" * 70)
 
     time.sleep(1)
-    saga_speaks(tts_voice, output_dev, "Comprehensive analysis follows.")
+    dr_saga_speaks(tts_voice, speaker, "Comprehensive analysis follows.")
     time.sleep(0.5)
 
     # Count intelligible responses
@@ -361,23 +656,23 @@ def main():
     print(f"   Intelligible responses: {intelligible_count}")
     print(f"   Success rate: {intelligible_count/total_count*100:.1f}%")
 
-    saga_speaks(tts_voice, output_dev,
+    dr_saga_speaks(tts_voice, speaker,
                f"The subject produced intelligible vocalisations in {intelligible_count} of {total_count} trials.")
     time.sleep(0.5)
 
     if intelligible_count > 8:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "This indicates a highly developed linguistic capacity.")
     elif intelligible_count > 4:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "This suggests moderate linguistic competence with possible dialectal variation.")
     else:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "The subject's language appears highly divergent or context-dependent.")
 
     # Word frequency analysis
     time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Analyzing phonetic patterns.")
+    dr_saga_speaks(tts_voice, speaker, "Analyzing phonetic patterns.")
 
     word_freq = analyze_words(all_responses)
 
@@ -388,15 +683,15 @@ def main():
             print(f"     - '{word}': {count} occurrences")
 
         most_common = word_freq[0][0]
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    f"The most frequently occurring lexeme is '{most_common}'. This may indicate a core grammatical element.")
     else:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "Insufficient data for phonetic pattern analysis.")
 
     # Grammar construction attempt
     time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Attempting grammatical construction.")
+    dr_saga_speaks(tts_voice, speaker, "Attempting grammatical construction.")
 
     # Find responses with multiple words
     multi_word = [(k, v) for k, v in all_responses.items() if v and len(v.split()) > 2]
@@ -407,12 +702,12 @@ def main():
         for key, utterance in multi_word[:3]:
             print(f"     - {key}: \"{utterance}\"")
 
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    f"The subject produced {len(multi_word)} multi-word utterances, suggesting syntactic structure.")
     else:
         print(f"\n📖 GRAMMATICAL ANALYSIS:")
         print(f"   Limited multi-word utterances detected")
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "Grammatical structure remains unclear. Further study required.")
 
     # Conclusions
@@ -421,42 +716,46 @@ def main():
     print("CONCLUSIONS")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Preliminary conclusions.")
+    dr_saga_speaks(tts_voice, speaker, "Preliminary conclusions.")
     time.sleep(0.5)
 
     if intelligible_count > 6:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "Subject Squawkers demonstrates a complex linguistic system with distinct response patterns.")
         time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "I recommend longitudinal study to document contextual usage and pragmatic function.")
     else:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "The subject's communication system is highly specialized or culturally specific.")
         time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "I recommend immersive fieldwork to establish cultural context.")
 
-    # ADDITIONAL DATA COLLECTION - Button C
-    time.sleep(1)
-    print("\n" + "=" * 70)
-    print("ADDITIONAL DATA COLLECTION")
-    print("=" * 70)
+    # ADDITIONAL DATA COLLECTION - Button C, only when the data set is thin
+    need_button_c = intelligible_count < 8
 
-    if intelligible_count < 8:
-        saga_speaks(tts_voice, output_dev, "Data set insufficient for confident analysis.")
+    if need_button_c:
+        time.sleep(1)
+        print("\n" + "=" * 70)
+        print("ADDITIONAL DATA COLLECTION")
+        print("=" * 70)
+
+        dr_saga_speaks(tts_voice, speaker, "Data set insufficient for confident analysis.")
         time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev, "I must collect the previously omitted data point.")
+        dr_saga_speaks(tts_voice, speaker, "I must collect the previously omitted data point.")
         time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev, "Testing button C despite potential external effects.")
-
-        heard = test_response(squawkers, stt_model, vad, input_dev,
-                            'button_c',
-                            'Response Button C',
-                            test_num)
+        dr_saga_speaks(tts_voice, speaker, "Testing button C despite potential external effects.")
+
+        audio = record_response(squawkers, vad, mic_frames,
+                                triggers['button_c'],
+                                'Response Button C',
+                                test_num)
+        pending = stt_executor.submit(transcribe_response, stt_model, audio)
+        dr_saga_speaks(tts_voice, speaker, "Data point acquired.")
+        heard = pending.result()
         button_responses['button_c'] = heard
         all_responses['button_c'] = heard
-        saga_speaks(tts_voice, output_dev, "Data point acquired.")
 
         # Recalculate statistics
         intelligible_count = sum(1 for v in all_responses.values() if v)
@@ -466,11 +765,11 @@ def main():
         print(f"   Total stimuli tested: {total_count}")
         print(f"   Intelligible responses: {intelligible_count}")
         print(f"   Success rate: {intelligible_count/total_count*100:.1f}%")
-    else:
-        saga_speaks(tts_voice, output_dev, "Data set sufficient. Button C remains omitted.")
 
     time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "End recording. Report to follow.")
+    if not need_button_c:
+        dr_saga_speaks(tts_voice, speaker, "Data set sufficient. Button C remains omitted.")
+    dr_saga_speaks(tts_voice, speaker, "End recording. Report to follow.")
 
     # FINAL SUMMARY
     print("\n" + "=" * 70)
@@ -499,6 +798,10 @@ def main():
     print(f"  Analysis confidence: {'High' if intelligible_count > 8 else 'Moderate' if intelligible_count > 4 else 'Low'}")
     print()
 
+    stt_executor.shutdown()
+    mic.close()
+    speaker.close()
+
 
 if __name__ == "__main__":
     try:
@@ -22,47 +22,151 @@ import numpy as np
 import sounddevice as sd
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from squawkers.squawkers_full import SquawkersFull
 from saga_assistant.ha_client import HomeAssistantClient
-from piper import PiperVoice
-from faster_whisper import WhisperModel
+from _models import STT_THREADS, get_stt, get_tts
+from _audio_devices import find_emeet_input
+from _model_service import batched_pipeline, connect_models
+from _saga_demo_utils import open_speaker, saga_speaks
+from _tts_cache import render
 
 # Configuration
 TTS_VOICE = "en_GB-semaine-medium"
-STT_MODEL = "base"  # Perfect for hilarious mishearings!
+STT_MODEL = "tiny.en"  # Fast on short clips, and perfect for hilarious mishearings!
 RECORDING_DURATION = 3.0  # Listen for 3 seconds after each button
+LINE_GAP_S = 0.3  # Beat after each of Saga's lines; the only scripted pause
+REC_SAMPLES = int(RECORDING_DURATION * 16000)
+
+MAX_PHASE_TESTS = 6
+
+# Each phase records its int16 clips back to back into one block, scaled into
+# this float32 buffer for Whisper. The single STT worker runs one batch at a
+# time, so one buffer is enough.
+INT16_TO_FLOAT = np.float32(1 / 32768)
+FLOAT_SCRATCH = np.empty(MAX_PHASE_TESTS * REC_SAMPLES, dtype=np.float32)
+
+# Varied responses to avoid monotony
+BUTTON_COMMENTS = [
+    "Fascinating.",
+    "Interesting variation.",
+    "Noted.",
+    "Remarkable.",
+    "Most intriguing."
+]
+
+# Varied responses for gags
+GAG_COMMENTS = [
+    "Curious.",
+    "Quite distinct.",
+    "I see.",
+    "Notable phonetic shift.",
+    "Interesting.",
+    "Significant variation."
+]
+
+# Lines Saga says on every run, synthesized once before the session starts
+CANNED_LINES = (
+    "Recording now. Subject Squawkers, comprehensive linguistic analysis, session one.",
+    "I have obtained access to the subject's complete communication interface.",
+    "I will systematically elicit all available responses to fully document the language system.",
+    "Beginning phase one. Response set alpha.",
+    "Skipping button C temporarily.",
+    "Phase one complete. Proceeding to phase two.",
+    "Beginning phase two. Response set beta.",
+    "Thank you. That's enough for now.",
+    "Phase two complete. Beginning analysis.",
+    "Comprehensive analysis follows.",
+    "Analyzing phonetic patterns.",
+    "Attempting grammatical construction.",
+    "Preliminary conclusions.",
+    "End recording. Report to follow.",
+    *BUTTON_COMMENTS,
+    *GAG_COMMENTS,
+)
+
+# Synthesized int16 audio keyed by text, so no line is rendered twice
+TTS_CACHE = {}
+
+# Punctuation Whisper attaches to words; apostrophes stay so contractions survive
+PUNCT_TABLE = str.maketrans("", "", "!?.,;:\"")
+
+
+def dr_saga_speaks(tts_voice, speaker, text):
+    """Dr. Saga speaks (see _saga_demo_utils.saga_speaks), canned lines from TTS_CACHE."""
+    saga_speaks(tts_voice, speaker, text, pause=LINE_GAP_S, cache=False, name="Dr. Saga",
+                rendered=TTS_CACHE)
+
+
+def prepare_voice(tts_voice=None):
+    """Load Saga's voice (unless the model service supplied one) and rehearse her lines."""
+    if tts_voice is None:
+        tts_voice = get_tts(TTS_VOICE)
+
+    for line in CANNED_LINES:
+        if line not in TTS_CACHE:
+            TTS_CACHE[line] = render(tts_voice, line)
+
+    return tts_voice
+
+
+def prepare_stt(stt_model=None):
+    """Load Whisper (already warm from get_stt) unless the model service supplied it."""
+    if stt_model is None:
+        stt_model = get_stt(STT_MODEL, cpu_threads=STT_THREADS)
+
+    return stt_model
+
+
+def transcribe_batch(batched_stt, clips):
+    """
+    Transcribe a phase's clips in one batched Whisper call.
+
+    clips is the (n, REC_SAMPLES, 1) int16 block the phase recorded into, so
+    the clips already sit end to end; each becomes one clip_timestamps entry.
+    Returns one transcript per clip.
+    """
+    # Convert and scale in one pass, straight into the scratch buffer
+    audio_np = FLOAT_SCRATCH[:clips.size]
+    np.multiply(clips.reshape(-1), INT16_TO_FLOAT, out=audio_np)
+
+    # Fixed short clips: no beam search or temperature fallback, text only.
+    # With clip_timestamps the batched pipeline already skips Whisper's VAD
+    # and never conditions on previous text, and it doesn't apply the
+    # log-prob/compression/no-speech thresholds at all, so those flags would
+    # be no-ops here. Squawks often score as "no speech", and they're exactly
+    # what the study wants transcribed.
+    segments, _ = batched_stt.transcribe(
+        audio_np,
+        language="en",
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        without_timestamps=True,
+        clip_timestamps=[{"start": i * RECORDING_DURATION, "end": (i + 1) * RECORDING_DURATION}
+                         for i in range(len(clips))],
+        batch_size=len(clips)
+    )
 
+    # Segments carry times in the joined audio; map each back to its clip
+    texts = [[] for _ in clips]
+    for seg in segments:
+        slot = min(int((seg.start + seg.end) / 2 // RECORDING_DURATION), len(clips) - 1)
+        texts[slot].append(seg.text.strip())
 
-def find_emeet_input():
-    """Find EMEET input device for recording."""
-    devices = sd.query_devices()
-    for idx, device in enumerate(devices):
-        if "EMEET" in device['name'] and device['max_input_channels'] > 0:
-            return idx
-    return None
-
-
-def saga_speaks(tts_voice, output_device, text):
-    """Saga speaks via TTS."""
-    print(f"\n🤖 Dr. Saga: \"{text}\"")
-
-    audio_chunks = []
-    for audio_chunk in tts_voice.synthesize(text):
-        audio_chunks.append(audio_chunk.audio_int16_array)
-
-    if audio_chunks:
-        audio_array = np.concatenate(audio_chunks)
-        sd.play(audio_array, samplerate=tts_voice.config.sample_rate, device=output_device)
-        sd.wait()
+    return [" ".join(parts).strip() for parts in texts]
 
-    time.sleep(0.3)
 
+def test_response(squawkers, input_dev, method_name, label, test_num, out, reset_after=False):
+    """
+    Test a response and record what we hear.
 
-def test_response(squawkers, stt_model, input_dev, method_name, label, test_num, reset_after=False):
-    """Test a response and record what we hear."""
+    The clip goes into out, one (REC_SAMPLES, 1) row of the phase's block;
+    it's transcribed with the rest of the phase by transcribe_batch().
+    """
     print(f"\n{'─' * 60}")
     print(f"TEST {test_num}: {label}")
     print(f"{'─' * 60}")
@@ -71,12 +175,12 @@ def test_response(squawkers, stt_model, input_dev, method_name, label, test_num,
     print(f"🎧 *listening for {RECORDING_DURATION}s...*")
 
     # Start recording in background
-    audio = sd.rec(
-        int(RECORDING_DURATION * 16000),
+    sd.rec(
+        REC_SAMPLES,
         samplerate=16000,
         channels=1,
-        dtype='float32',
-        device=input_dev
+        device=input_dev,
+        out=out
     )
 
     # Trigger parrot IMMEDIATELY (no delay - recording already started)
@@ -86,39 +190,34 @@ def test_response(squawkers, stt_model, input_dev, method_name, label, test_num,
     # Wait for recording to complete
     sd.wait()
 
-    # Transcribe
-    audio_np = audio.flatten()
-    segments, _ = stt_model.transcribe(audio_np, language="en")
-    heard = " ".join([seg.text.strip() for seg in segments]).strip()
-
-    if heard:
-        print(f"📝 Subject said: \"{heard}\"")
-    else:
-        print(f"📝 Subject said: [unintelligible vocalisation]")
-
     # If this triggers dance, reset afterwards
     if reset_after:
         time.sleep(1.0)
         squawkers.reset()
         print("🛑 Dance interrupted with RESET")
 
-    return heard
+
+def report_phase(labels, heard):
+    """Print what the subject said in each test of a batched phase."""
+    for label, text in zip(labels, heard):
+        if text:
+            print(f"📝 {label}: \"{text}\"")
+        else:
+            print(f"📝 {label}: [unintelligible vocalisation]")
 
 
 def analyze_words(responses):
     """Analyze word frequency for 'phonetic patterns'."""
-    all_words = []
-    for text in responses.values():
-        if text:
-            # Simple word split
-            words = text.lower().replace("!", "").replace("?", "").replace(".", "").split()
-            all_words.extend(words)
+    word_counts = Counter(
+        word
+        for text in responses.values() if text
+        for word in text.lower().translate(PUNCT_TABLE).split()
+    )
 
-    if not all_words:
+    if not word_counts:
         return None
 
     # Get most common words
-    word_counts = Counter(all_words)
     return word_counts.most_common(5)
 
 
@@ -134,48 +233,65 @@ def main():
     # Initialize everything
     print("\nInitializing research equipment...")
 
-    # Home Assistant & Squawkers
-    client = HomeAssistantClient()
-    squawkers = SquawkersFull(client)
+    # The models and the mic lookup are independent of each other and of
+    # Home Assistant, and Piper/CTranslate2 load in native code, so they all
+    # start at once
+    with ThreadPoolExecutor(max_workers=3) as init_pool:
+        input_dev_fut = init_pool.submit(find_emeet_input)
+
+        # Models come from a running _model_service.py when there is one,
+        # otherwise they're loaded here
+        try:
+            tts_voice, stt_model = connect_models(TTS_VOICE, STT_MODEL) or (None, None)
+        except FileNotFoundError:
+            print(f"❌ TTS voice not found. Run Saga assistant first.")
+            return 1
+
+        if tts_voice is not None:
+            print("Using models from the model service...")
+        else:
+            print("Loading voice and speech recognition models...")
+        voice_fut = init_pool.submit(prepare_voice, tts_voice)
+        stt_fut = init_pool.submit(prepare_stt, stt_model)
 
-    # TTS
-    models_dir = Path.home() / ".local" / "share" / "piper" / "voices"
-    model_file = models_dir / f"{TTS_VOICE}.onnx"
-    config_file = models_dir / f"{TTS_VOICE}.onnx.json"
+        # Home Assistant & Squawkers
+        client = HomeAssistantClient()
+        squawkers = SquawkersFull(client)
 
-    if not (model_file.exists() and config_file.exists()):
-        print(f"❌ TTS voice not found. Run Saga assistant first.")
-        return 1
+        try:
+            tts_voice = voice_fut.result()
+        except FileNotFoundError:
+            print(f"❌ TTS voice not found. Run Saga assistant first.")
+            return 1
 
-    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
+        stt_model = stt_fut.result()
+        input_dev = input_dev_fut.result()
 
-    # STT
-    print("Loading speech recognition model...")
-    stt_model = WhisperModel(STT_MODEL, device="cpu", compute_type="int8")
+    # One worker: each phase's batch transcribes while the session carries on
+    batched_stt = batched_pipeline(stt_model)
+    stt_pool = ThreadPoolExecutor(max_workers=1)
 
     # Audio devices
-    input_dev = find_emeet_input()
     if input_dev is None:
         input_dev = sd.default.device[0]
 
     output_dev = sd.default.device[1]
 
+    # One output stream for the whole session, fed by dr_saga_speaks
+    speaker = open_speaker(tts_voice, output_dev)
+
     print("✓ Equipment ready!\n")
-    time.sleep(1)
 
     # BEGIN STUDY
     print("\n" + "=" * 70)
     print("SESSION START - COMPREHENSIVE STUDY")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Recording now. Subject Squawkers, comprehensive linguistic analysis, session one.")
-    time.sleep(0.5)
+    dr_saga_speaks(tts_voice, speaker, "Recording now. Subject Squawkers, comprehensive linguistic analysis, session one.")
 
-    saga_speaks(tts_voice, output_dev, "I have obtained access to the subject's complete communication interface.")
-    time.sleep(0.5)
+    dr_saga_speaks(tts_voice, speaker, "I have obtained access to the subject's complete communication interface.")
 
-    saga_speaks(tts_voice, output_dev, "I will systematically elicit all available responses to fully document the language system.")
-    time.sleep(1)
+    dr_saga_speaks(tts_voice, speaker, "I will systematically elicit all available responses to fully document the language system.")
 
     # Store all responses
     all_responses = {}
@@ -186,27 +302,25 @@ def main():
     print("PHASE 1: RESPONSE SET ALPHA (Buttons A-F)")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Beginning phase one. Response set alpha.")
+    dr_saga_speaks(tts_voice, speaker, "Beginning phase one. Response set alpha.")
 
     button_responses = {}
 
-    # Varied responses to avoid monotony
-    button_comments = [
-        "Fascinating.",
-        "Interesting variation.",
-        "Noted.",
-        "Remarkable.",
-        "Most intriguing."
-    ]
-
-    for idx, letter in enumerate(['a', 'b', 'd', 'e', 'f']):  # Skip C for now
-        heard = test_response(squawkers, stt_model, input_dev,
-                            f'button_{letter}',
-                            f'Response Button {letter.upper()}',
-                            test_num)
-        button_responses[f'button_{letter}'] = heard
-        all_responses[f'button_{letter}'] = heard
-        saga_speaks(tts_voice, output_dev, button_comments[idx])
+    # Saga's comments are canned, so transcription waits for the end of the
+    # phase and runs as one batch
+    letters = ['a', 'b', 'd', 'e', 'f']  # Skip C for now
+    phase_keys, phase_labels = [], []
+    phase_clips = np.empty((len(letters), REC_SAMPLES, 1), dtype=np.int16)
+
+    for idx, letter in enumerate(letters):
+        test_response(squawkers, input_dev,
+                      f'button_{letter}',
+                      f'Response Button {letter.upper()}',
+                      test_num,
+                      phase_clips[idx])
+        phase_keys.append(f'button_{letter}')
+        phase_labels.append(f'Response Button {letter.upper()}')
+        dr_saga_speaks(tts_voice, speaker, BUTTON_COMMENTS[idx])
         test_num += 1
 
         if test_num == 3:  # After button B, acknowledge skipping C
@@ -214,68 +328,73 @@ def main():
             print(f"NOTE: Button C")
             print(f"{'─' * 60}")
             print(f"⚠️  SKIPPED FOR NOW - Will revisit if more data needed")
-            saga_speaks(tts_voice, output_dev, "Skipping button C temporarily.")
+            dr_saga_speaks(tts_voice, speaker, "Skipping button C temporarily.")
             test_num += 1
 
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Phase one complete. Proceeding to phase two.")
+    # Phase one transcribes in the background while phase two runs
+    phase_one = (phase_keys, phase_labels,
+                 stt_pool.submit(transcribe_batch, batched_stt, phase_clips))
+
+    dr_saga_speaks(tts_voice, speaker, "Phase one complete. Proceeding to phase two.")
 
     # PHASE 2: Gags
     print("\n" + "=" * 70)
     print("PHASE 2: RESPONSE SET BETA (Gags A-F)")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Beginning phase two. Response set beta.")
+    dr_saga_speaks(tts_voice, speaker, "Beginning phase two. Response set beta.")
 
     gag_responses = {}
 
-    # Varied responses for gags
-    gag_comments = [
-        "Curious.",
-        "Quite distinct.",
-        "I see.",
-        "Notable phonetic shift.",
-        "Interesting.",
-        "Significant variation."
-    ]
-
-    for idx, letter in enumerate(['a', 'b', 'c', 'd', 'e', 'f']):
+    letters = ['a', 'b', 'c', 'd', 'e', 'f']
+    phase_keys, phase_labels = [], []
+    phase_clips = np.empty((len(letters), REC_SAMPLES, 1), dtype=np.int16)
+
+    for idx, letter in enumerate(letters):
         # Gag F triggers dance, handle specially
         if letter == 'f':
-            heard = test_response(squawkers, stt_model, input_dev,
-                                f'gag_{letter}',
-                                f'Gag Response {letter.upper()}',
-                                test_num,
-                                reset_after=False)  # Don't auto-reset
-            gag_responses[f'gag_{letter}'] = heard
-            all_responses[f'gag_{letter}'] = heard
+            test_response(squawkers, input_dev,
+                          f'gag_{letter}',
+                          f'Gag Response {letter.upper()}',
+                          test_num,
+                          phase_clips[idx],
+                          reset_after=False)  # Don't auto-reset
             # Saga interrupts the dance
-            saga_speaks(tts_voice, output_dev, "Thank you. That's enough for now.")
+            dr_saga_speaks(tts_voice, speaker, "Thank you. That's enough for now.")
             squawkers.reset()
             print("🛑 Dance interrupted with RESET")
         else:
-            heard = test_response(squawkers, stt_model, input_dev,
-                                f'gag_{letter}',
-                                f'Gag Response {letter.upper()}',
-                                test_num,
-                                reset_after=False)
-            gag_responses[f'gag_{letter}'] = heard
-            all_responses[f'gag_{letter}'] = heard
-            saga_speaks(tts_voice, output_dev, gag_comments[idx])
-
+            test_response(squawkers, input_dev,
+                          f'gag_{letter}',
+                          f'Gag Response {letter.upper()}',
+                          test_num,
+                          phase_clips[idx],
+                          reset_after=False)
+            dr_saga_speaks(tts_voice, speaker, GAG_COMMENTS[idx])
+
+        phase_keys.append(f'gag_{letter}')
+        phase_labels.append(f'Gag Response {letter.upper()}')
         test_num += 1
 
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Phase two complete. Beginning analysis.")
+    phase_two = (phase_keys, phase_labels,
+                 stt_pool.submit(transcribe_batch, batched_stt, phase_clips))
+
+    dr_saga_speaks(tts_voice, speaker, "Phase two complete. Beginning analysis.")
+
+    print("\n📝 TRANSCRIPTS:")
+    for (keys, labels, pending), responses in ((phase_one, button_responses),
+                                               (phase_two, gag_responses)):
+        heard = pending.result()
+        report_phase(labels, heard)
+        responses.update(zip(keys, heard))
+        all_responses.update(zip(keys, heard))
 
     # ANALYSIS
     print("\n" + "=" * 70)
     print("COMPREHENSIVE ANALYSIS")
     print("=" * 70)
 
-    time.sleep(1)
-    saga_speaks(tts_voice, output_dev, "Comprehensive analysis follows.")
-    time.sleep(0.5)
+    dr_saga_speaks(tts_voice, speaker, "Comprehensive analysis follows.")
 
     # Count intelligible responses
     intelligible_count = sum(1 for v in all_responses.values() if v)
@@ -286,23 +405,21 @@ def main():
     print(f"   Intelligible responses: {intelligible_count}")
     print(f"   Success rate: {intelligible_count/total_count*100:.1f}%")
 
-    saga_speaks(tts_voice, output_dev,
+    dr_saga_speaks(tts_voice, speaker,
                f"The subject produced intelligible vocalisations in {intelligible_count} of {total_count} trials.")
-    time.sleep(0.5)
 
     if intelligible_count > 8:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "This indicates a highly developed linguistic capacity.")
     elif intelligible_count > 4:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "This suggests moderate linguistic competence with possible dialectal variation.")
     else:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "The subject's language appears highly divergent or context-dependent.")
 
     # Word frequency analysis
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Analyzing phonetic patterns.")
+    dr_saga_speaks(tts_voice, speaker, "Analyzing phonetic patterns.")
 
     word_freq = analyze_words(all_responses)
 
@@ -313,15 +430,14 @@ def main():
             print(f"     - '{word}': {count} occurrences")
 
         most_common = word_freq[0][0]
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    f"The most frequently occurring lexeme is '{most_common}'. This may indicate a core grammatical element.")
     else:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "Insufficient data for phonetic pattern analysis.")
 
     # Grammar construction attempt
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Attempting grammatical construction.")
+    dr_saga_speaks(tts_voice, speaker, "Attempting grammatical construction.")
 
     # Find responses with multiple words
     multi_word = [(k, v) for k, v in all_responses.items() if v and len(v.split()) > 2]
@@ -332,56 +448,54 @@ def main():
         for key, utterance in multi_word[:3]:
             print(f"     - {key}: \"{utterance}\"")
 
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    f"The subject produced {len(multi_word)} multi-word utterances, suggesting syntactic structure.")
     else:
         print(f"\n📖 GRAMMATICAL ANALYSIS:")
         print(f"   Limited multi-word utterances detected")
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "Grammatical structure remains unclear. Further study required.")
 
     # Conclusions
-    time.sleep(1)
     print("\n" + "=" * 70)
     print("CONCLUSIONS")
     print("=" * 70)
 
-    saga_speaks(tts_voice, output_dev, "Preliminary conclusions.")
-    time.sleep(0.5)
+    dr_saga_speaks(tts_voice, speaker, "Preliminary conclusions.")
 
     if intelligible_count > 6:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "Subject Squawkers demonstrates a complex linguistic system with distinct response patterns.")
-        time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "I recommend longitudinal study to document contextual usage and pragmatic function.")
     else:
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "The subject's communication system is highly specialized or culturally specific.")
-        time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev,
+        dr_saga_speaks(tts_voice, speaker,
                    "I recommend immersive fieldwork to establish cultural context.")
 
     # ADDITIONAL DATA COLLECTION - Button C
-    time.sleep(1)
     print("\n" + "=" * 70)
     print("ADDITIONAL DATA COLLECTION")
     print("=" * 70)
 
     if intelligible_count < 8:
-        saga_speaks(tts_voice, output_dev, "Data set insufficient for confident analysis.")
-        time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev, "I must collect the previously omitted data point.")
-        time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev, "Testing button C despite potential external effects.")
-
-        heard = test_response(squawkers, stt_model, input_dev,
-                            'button_c',
-                            'Response Button C',
-                            test_num)
+        dr_saga_speaks(tts_voice, speaker, "Data set insufficient for confident analysis.")
+        dr_saga_speaks(tts_voice, speaker, "I must collect the previously omitted data point.")
+        dr_saga_speaks(tts_voice, speaker, "Testing button C despite potential external effects.")
+
+        clip = np.empty((1, REC_SAMPLES, 1), dtype=np.int16)
+        test_response(squawkers, input_dev,
+                      'button_c',
+                      'Response Button C',
+                      test_num,
+                      clip[0])
+        pending = stt_pool.submit(transcribe_batch, batched_stt, clip)
+        dr_saga_speaks(tts_voice, speaker, "Data point acquired.")
+        heard = pending.result()[0]
+        report_phase(['Response Button C'], [heard])
         button_responses['button_c'] = heard
         all_responses['button_c'] = heard
-        saga_speaks(tts_voice, output_dev, "Data point acquired.")
 
         # Recalculate statistics
         intelligible_count = sum(1 for v in all_responses.values() if v)
@@ -392,10 +506,9 @@ def main():
         print(f"   Intelligible responses: {intelligible_count}")
         print(f"   Success rate: {intelligible_count/total_count*100:.1f}%")
     else:
-        saga_speaks(tts_voice, output_dev, "Data set sufficient. Button C remains omitted.")
+        dr_saga_speaks(tts_voice, speaker, "Data set sufficient. Button C remains omitted.")
 
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "End recording. Report to follow.")
+    dr_saga_speaks(tts_voice, speaker, "End recording. Report to follow.")
 
     # FINAL SUMMARY
     print("\n" + "=" * 70)
@@ -424,6 +537,9 @@ def main():
     print(f"  Analysis confidence: {'High' if intelligible_count > 8 else 'Moderate' if intelligible_count > 4 else 'Low'}")
     print()
 
+    stt_pool.shutdown()
+    speaker.close()
+
 
 if __name__ == "__main__":
     try:
@@ -19,24 +19,26 @@ This is going to be fascinating.
 """
 
 import sys
+import re
 import time
+import functools
 import argparse
 import subprocess
 import numpy as np
 import sounddevice as sd
 import webrtcvad
 from pathlib import Path
-from collections import deque
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from piper import PiperVoice
-from faster_whisper import WhisperModel
+from _audio_devices import find_emeet_input
+from _tts_cache import render
 
 # Configuration
 TTS_VOICE = "en_GB-semaine-medium"  # Saga's voice
 STT_MODEL = "base"  # For interesting mishearings
+LINE_GAP_S = 0.3  # Beat after each of Saga's lines; the only scripted pause
 
 # VAD Configuration
 SAMPLE_RATE = 16000
@@ -44,12 +46,24 @@ VAD_MODE = 2
 VAD_FRAME_MS = 30
 MIN_SPEECH_CHUNKS = 2
 MIN_SILENCE_CHUNKS = 23
+PRE_SPEECH_CHUNKS = 20  # ~600ms pre-speech
 MAX_RECORDING_DURATION_S = 30  # Longer to handle complete entity responses
+MAX_SAMPLES = MAX_RECORDING_DURATION_S * SAMPLE_RATE
+
+# int16 -> [-1, 1) float32 for Whisper, written into one buffer reused every turn
+INT16_TO_FLOAT = np.float32(1 / 32768)
+FLOAT_SCRATCH = np.empty(MAX_SAMPLES, dtype=np.float32)
 
 # LLM Configuration for the "Unknown Entity"
 LLM_BASE_URL = "http://loki.local:11434/v1"
 ENTITY_MODEL = "qwen2.5:7b"  # Can be changed - qwen2.5:7b, qwen2.5:14b, llama3.1:8b, etc.
 LOKI_HOST = "loki.local"
+# Assumes piper-tts is installed on loki; adjust the voice model as needed
+ENTITY_TTS_CMD = "piper --model en_US-lessac-medium --output-raw | aplay -r 22050 -f S16_LE -c 1"
+
+# Sentence end in a streamed reply: terminal punctuation once whitespace follows
+# (so "3.5" isn't split), or a line break
+SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
 
 # System prompt for the unknown entity
 # Designed for productive AI-to-AI communication
@@ -66,73 +80,134 @@ Your communication approach:
 
 This is a scientific study of digital-to-digital communication. Be authentic."""
 
+# Question sequence - designed to test Saga's capabilities
+QUESTIONS = [
+    "Hello. Can you hear me?",
+    "I am Dr. Saga, a digital intelligence conducting research. What are you?",
+    "How should we optimize our communication? What response length works best for you?",
+    "Describe how you process information.",
+    "What are your capabilities and limitations?",
+    "Can you ask me questions about my own nature?",
+    "What would you like to know about digital-to-digital communication?"
+]
+
+# Everything Saga says is scripted, so it's all synthesized in the background,
+# in speaking order, while the session gets going
+CANNED_LINES = (
+    "Recording now. First contact protocol, session one.",
+    "I am Dr. Saga. I am a researcher studying forms of intelligence.",
+    "I have established a communication channel with an unknown entity.",
+    "I will now attempt first contact.",
+    *QUESTIONS,
+    "Preliminary analysis follows.",
+    "The entity demonstrates linguistic capability.",
+    "Response patterns suggest deliberate communication.",
+    "Classification remains uncertain.",
+    "I recommend continued observation and dialogue.",
+    "End recording. Further contact advised.",
+)
+
+# Futures of synthesized int16 audio keyed by text, so no line is rendered twice
+TTS_CACHE = {}
+
+
+def prerender(tts_pool, tts_voice, lines):
+    """
+    Queue lines for synthesis on tts_pool, in order, recording each in TTS_CACHE.
 
-def find_emeet_input():
-    """Find EMEET input device."""
-    devices = sd.query_devices()
-    for idx, device in enumerate(devices):
-        if "EMEET" in device['name'] and device['max_input_channels'] > 0:
-            return idx
-    return None
+    Piper releases the GIL inside ONNX Runtime, so line N+1 renders while
+    line N plays. Lines not queued here are streamed by dr_saga_speaks; this
+    script has none, which keeps Piper to one thread at a time.
+    """
+    for line in lines:
+        if line not in TTS_CACHE:
+            TTS_CACHE[line] = tts_pool.submit(render, tts_voice, line)
 
 
-def saga_speaks(tts_voice, output_device, text):
-    """Dr. Saga speaks."""
-    print(f"\n🤖 Dr. Saga: \"{text}\"")
+def open_entity_voice():
+    """
+    Start one long-lived piper | aplay pipeline on loki.local over SSH.
+
+    Piper speaks each line written to its stdin, so every turn skips the SSH
+    handshake and piper's model load, and the text never passes through a
+    remote shell.
+    """
+    return subprocess.Popen(
+        ["ssh", LOKI_HOST, ENTITY_TTS_CMD],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        text=True
+    )
 
-    audio_chunks = []
-    for audio_chunk in tts_voice.synthesize(text):
-        audio_chunks.append(audio_chunk.audio_int16_array)
 
-    if audio_chunks:
-        audio_array = np.concatenate(audio_chunks)
-        sd.play(audio_array, samplerate=tts_voice.config.sample_rate, device=output_device)
-        sd.wait()
+def say_line(entity_voice, text):
+    """Queue one utterance on loki's piper pipeline. Returns False if it's gone."""
+    try:
+        # One utterance per line; piper starts on it as soon as it's flushed
+        entity_voice.stdin.write(" ".join(text.split()) + "\n")
+        entity_voice.stdin.flush()
+        return True
+    except OSError:
+        print(f"   ⚠️  Entity speech failed (pipeline exited: {entity_voice.poll()})")
+        print(f"   Note: Make sure piper is installed on {LOKI_HOST}")
+        print(f"   You can read the response aloud instead.")
+        return False
+
+
+def ask_entity(llm_pool, client, conversation_history, entity_model):
+    """
+    Start the entity's streamed reply on llm_pool and return its future.
 
-    time.sleep(0.3)
+    Called before Saga voices the question, so the LLM works through the
+    prompt while she's still speaking.
+    """
+    return llm_pool.submit(
+        client.chat.completions.create,
+        model=entity_model,
+        messages=list(conversation_history),
+        temperature=0.7,
+        max_tokens=500,  # Allow longer responses for complete thoughts
+        stream=True
+    )
 
 
-def entity_speaks_remote(client, conversation_history, entity_model):
+def entity_speaks_remote(pending_reply, entity_voice):
     """
-    The unknown entity generates a response and speaks it via loki.local TTS.
+    The unknown entity speaks its reply (from ask_entity) via loki.local TTS.
 
-    This uses SSH to run piper-tts on loki and play the audio there.
-    Saga will listen to it via her microphone.
+    The reply is streamed, and each sentence goes to the pipeline from
+    open_entity_voice() as soon as it's complete, so loki starts talking
+    while the rest is still being generated. Saga listens via her microphone,
+    so start saga_listens_vad before calling this.
     """
     try:
-        # Generate response
-        response = client.chat.completions.create(
-            model=entity_model,
-            messages=conversation_history,
-            temperature=0.7,
-            max_tokens=500  # Allow longer responses for complete thoughts
-        )
-
-        text = response.choices[0].message.content.strip()
-        print(f"\n👤 Entity: \"{text}\"")
+        response = pending_reply.result()
 
-        # Have loki speak the response via TTS
-        # Escape text for shell
-        escaped_text = text.replace("'", "'\\''")
+        print("   🔊 Entity speaking via loki.local...")
 
-        # Command to run piper on loki and play audio
-        # Assumes piper-tts is installed on loki
-        # You may need to adjust the voice model path
-        ssh_cmd = [
-            "ssh", LOKI_HOST,
-            f"echo '{escaped_text}' | piper --model en_US-lessac-medium --output-raw | aplay -r 22050 -f S16_LE -c 1"
-        ]
+        parts = []
+        unspoken = ""
+        voice_ok = True
 
-        print("   🔊 Entity speaking via loki.local...")
+        for chunk in response:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if not token:
+                continue
+
+            parts.append(token)
+            unspoken += token
 
-        try:
-            subprocess.run(ssh_cmd, check=True, capture_output=True, timeout=30)
-        except subprocess.TimeoutExpired:
-            print("   ⚠️  Entity speech timeout")
-        except subprocess.CalledProcessError as e:
-            print(f"   ⚠️  Entity speech failed: {e}")
-            print(f"   Note: Make sure piper is installed on {LOKI_HOST}")
-            print(f"   You can read the response aloud instead.")
+            # Flush everything up to the last finished sentence
+            ends = [m.end() for m in SENTENCE_END_RE.finditer(unspoken)]
+            if ends and voice_ok:
+                voice_ok = say_line(entity_voice, unspoken[:ends[-1]])
+                unspoken = unspoken[ends[-1]:]
+
+        if unspoken.strip() and voice_ok:
+            say_line(entity_voice, unspoken)
+
+        text = "".join(parts).strip()
+        print(f"\n👤 Entity: \"{text}\"")
 
         return text
 
@@ -149,12 +224,21 @@ def saga_listens_vad(vad, input_dev, stt_model):
     speech_chunk_count = 0
     silence_chunk_count = 0
     is_recording = False
-    audio_buffer = []
-    pre_speech_buffer = deque(maxlen=20)
+
+    # Pre-speech lead-in kept as a fixed ring of frames; once it has wrapped,
+    # the oldest frame sits at ring_idx
+    ring = np.empty((PRE_SPEECH_CHUNKS, vad_frame_size), dtype=np.int16)
+    ring_idx = 0
+    ring_full = False
 
     max_chunks = int(MAX_RECORDING_DURATION_S * 1000 / VAD_FRAME_MS)
     chunk_count = 0
 
+    # Recording goes straight into one preallocated buffer instead of a list.
+    # Lead-in frames were read within max_chunks too, so this always fits.
+    audio_buffer = np.empty(max_chunks * vad_frame_size, dtype=np.int16)
+    wpos = 0
+
     try:
         with sd.InputStream(
             device=input_dev,
@@ -183,30 +267,41 @@ def saga_listens_vad(vad, input_dev, stt_model):
                         if speech_chunk_count >= MIN_SPEECH_CHUNKS:
                             print("   🔴 Speech detected")
                             is_recording = True
-                            audio_buffer.extend(pre_speech_buffer)
-                            audio_buffer.append(audio_chunk)
+                            lead_in = (ring[ring_idx:], ring[:ring_idx]) if ring_full else (ring[:ring_idx],)
+                            for block in lead_in:
+                                audio_buffer[wpos:wpos + block.size] = block.reshape(-1)
+                                wpos += block.size
+                            audio_buffer[wpos:wpos + vad_frame_size] = audio_chunk
+                            wpos += vad_frame_size
                     else:
-                        audio_buffer.append(audio_chunk)
+                        audio_buffer[wpos:wpos + vad_frame_size] = audio_chunk
+                        wpos += vad_frame_size
                 else:
                     silence_chunk_count += 1
                     speech_chunk_count = 0
 
                     if is_recording:
-                        audio_buffer.append(audio_chunk)
+                        audio_buffer[wpos:wpos + vad_frame_size] = audio_chunk
+                        wpos += vad_frame_size
 
                         if silence_chunk_count >= MIN_SILENCE_CHUNKS:
                             print(f"   ⏹️  Recording complete")
                             break
                     else:
-                        pre_speech_buffer.append(audio_chunk)
+                        ring[ring_idx] = audio_chunk
+                        ring_idx = (ring_idx + 1) % PRE_SPEECH_CHUNKS
+                        ring_full = ring_full or ring_idx == 0
 
     except Exception as e:
         print(f"   ❌ Recording error: {e}")
 
     # Transcribe
-    if audio_buffer:
-        audio_np = np.concatenate(audio_buffer)
-        audio_float = audio_np.astype(np.float32) / 32768.0
+    if wpos:
+        audio_np = audio_buffer[:wpos]
+
+        # Convert and scale in one pass, straight into the scratch buffer
+        audio_float = FLOAT_SCRATCH[:wpos]
+        np.multiply(audio_np, INT16_TO_FLOAT, out=audio_float)
         segments, _ = stt_model.transcribe(audio_float, language="en")
         heard = " ".join([seg.text.strip() for seg in segments]).strip()
     else:
@@ -231,6 +326,18 @@ def main():
                        help=f"Saga's STT model (default: {STT_MODEL})")
     args = parser.parse_args()
 
+    # The OpenAI client and the Whisper/Piper stacks behind _models each take
+    # hundreds of ms to import, so they wait until the arguments are good
+    # (--help and bad flags return instantly)
+    from openai import OpenAI
+    from _models import STT_THREADS, get_stt, get_tts
+    from _model_service import connect_models
+    from _saga_demo_utils import open_speaker, saga_speaks
+
+    # Dr. Saga's lines play from TTS_CACHE once prerender() has queued them
+    dr_saga_speaks = functools.partial(saga_speaks, pause=LINE_GAP_S, cache=False,
+                                       name="Dr. Saga", rendered=TTS_CACHE)
+
     entity_model = args.model
     stt_model_name = args.stt_model
 
@@ -245,20 +352,24 @@ def main():
     # Initialize
     print("\nInitializing research equipment...")
 
-    # TTS for Saga
-    models_dir = Path.home() / ".local" / "share" / "piper" / "voices"
-    model_file = models_dir / f"{TTS_VOICE}.onnx"
-    config_file = models_dir / f"{TTS_VOICE}.onnx.json"
-
-    if not (model_file.exists() and config_file.exists()):
+    # Models come from a running _model_service.py when there is one,
+    # otherwise they're loaded here
+    try:
+        models = connect_models(TTS_VOICE, stt_model_name)
+        if models:
+            print("Using models from the model service...")
+            tts_voice, stt_model = models
+        else:
+            print("Loading voice and speech recognition models...")
+            tts_voice = get_tts(TTS_VOICE)
+            stt_model = get_stt(stt_model_name, cpu_threads=STT_THREADS)
+    except FileNotFoundError:
         print(f"❌ TTS voice not found.")
         return 1
 
-    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
-
-    # STT
-    print("Loading speech recognition...")
-    stt_model = WhisperModel(stt_model_name, device="cpu", compute_type="int8")
+    # Dr. Saga rehearses her lines in the background, staying ahead of herself
+    tts_pool = ThreadPoolExecutor(max_workers=1)
+    prerender(tts_pool, tts_voice, CANNED_LINES)
 
     # VAD
     print("Initializing voice activity detection...")
@@ -272,9 +383,15 @@ def main():
 
     output_dev = sd.default.device[1]
 
+    # One output stream for the whole session, fed by dr_saga_speaks
+    speaker = open_speaker(tts_voice, output_dev)
+
     # Entity connection
     print(f"Establishing connection to entity at {LLM_BASE_URL}...")
     client = OpenAI(base_url=LLM_BASE_URL, api_key="dummy")
+    entity_voice = open_entity_voice()
+    llm_pool = ThreadPoolExecutor(max_workers=1)
+    listen_pool = ThreadPoolExecutor(max_workers=1)
 
     print("✓ Equipment ready!")
     print(f"✓ Entity will speak via {LOKI_HOST} TTS\n")
@@ -288,47 +405,33 @@ def main():
     print("SESSION START - FIRST CONTACT")
     print("=" * 70)
 
-    time.sleep(1)
-
     # Introduction
-    saga_speaks(tts_voice, output_dev, "Recording now. First contact protocol, session one.")
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "I am Dr. Saga. I am a researcher studying forms of intelligence.")
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "I have established a communication channel with an unknown entity.")
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "I will now attempt first contact.")
-    time.sleep(1)
-
-    # Question sequence - designed to test Saga's capabilities
-    questions = [
-        "Hello. Can you hear me?",
-        "I am Dr. Saga, a digital intelligence conducting research. What are you?",
-        "How should we optimize our communication? What response length works best for you?",
-        "Describe how you process information.",
-        "What are your capabilities and limitations?",
-        "Can you ask me questions about my own nature?",
-        "What would you like to know about digital-to-digital communication?"
-    ]
+    dr_saga_speaks(tts_voice, speaker, "Recording now. First contact protocol, session one.")
+    dr_saga_speaks(tts_voice, speaker, "I am Dr. Saga. I am a researcher studying forms of intelligence.")
+    dr_saga_speaks(tts_voice, speaker, "I have established a communication channel with an unknown entity.")
+    dr_saga_speaks(tts_voice, speaker, "I will now attempt first contact.")
 
-    for q_num, question in enumerate(questions, 1):
+    for q_num, question in enumerate(QUESTIONS, 1):
         print(f"\n{'─' * 70}")
         print(f"EXCHANGE {q_num}")
         print(f"{'─' * 70}")
 
+        # The entity starts on its reply while Saga is still asking
+        conversation_history.append({"role": "user", "content": question})
+        pending_reply = ask_entity(llm_pool, client, conversation_history, entity_model)
+
         # Saga asks
-        saga_speaks(tts_voice, output_dev, question)
+        dr_saga_speaks(tts_voice, speaker, question)
 
-        # Entity generates response and speaks it via loki
-        conversation_history.append({"role": "user", "content": question})
-        entity_response = entity_speaks_remote(client, conversation_history, entity_model)
-        conversation_history.append({"role": "assistant", "content": entity_response})
+        # Saga listens from now on: loki starts on the first sentence while
+        # the rest of the reply is still streaming in
+        pending_heard = listen_pool.submit(saga_listens_vad, vad, input_dev, stt_model)
 
-        # Small delay for entity speech to start
-        time.sleep(0.5)
+        # Entity speaks its response via loki
+        entity_response = entity_speaks_remote(pending_reply, entity_voice)
+        conversation_history.append({"role": "assistant", "content": entity_response})
 
-        # Saga listens
-        heard = saga_listens_vad(vad, input_dev, stt_model)
+        heard = pending_heard.result()
 
         # Saga's internal notes
         if heard:
@@ -336,26 +439,19 @@ def main():
         else:
             print(f"\n📝 Field note: No response detected")
 
-        time.sleep(1)
-
     # Analysis
     print(f"\n{'=' * 70}")
     print("PRELIMINARY ANALYSIS")
     print(f"{'=' * 70}")
 
-    saga_speaks(tts_voice, output_dev, "Preliminary analysis follows.")
-    time.sleep(0.5)
+    dr_saga_speaks(tts_voice, speaker, "Preliminary analysis follows.")
 
-    saga_speaks(tts_voice, output_dev, "The entity demonstrates linguistic capability.")
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Response patterns suggest deliberate communication.")
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "Classification remains uncertain.")
-    time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "I recommend continued observation and dialogue.")
-    time.sleep(0.5)
+    dr_saga_speaks(tts_voice, speaker, "The entity demonstrates linguistic capability.")
+    dr_saga_speaks(tts_voice, speaker, "Response patterns suggest deliberate communication.")
+    dr_saga_speaks(tts_voice, speaker, "Classification remains uncertain.")
+    dr_saga_speaks(tts_voice, speaker, "I recommend continued observation and dialogue.")
 
-    saga_speaks(tts_voice, output_dev, "End recording. Further contact advised.")
+    dr_saga_speaks(tts_voice, speaker, "End recording. Further contact advised.")
 
     print(f"\n{'=' * 70}")
     print("SESSION COMPLETE")
@@ -368,6 +464,14 @@ def main():
             print(f"  Entity: \"{msg['content']}\"")
     print()
 
+    # EOF lets piper finish whatever is still queued before ssh exits
+    entity_voice.stdin.close()
+    entity_voice.wait()
+    tts_pool.shutdown()
+    llm_pool.shutdown()
+    listen_pool.shutdown()
+    speaker.close()
+
 
 if __name__ == "__main__":
     try:
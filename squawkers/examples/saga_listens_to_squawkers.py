@@ -8,52 +8,45 @@ Since Squawkers just makes parrot noises, Saga mishears them as words.
 But she's a professional, so she takes it all very seriously.
 """
 
+import os
 import sys
 import time
+
+# Whisper (CTranslate2) and Piper (ONNX Runtime) get explicit thread counts
+# below; keep numpy's BLAS and any stray OpenMP pool from adding a thread per
+# core on top while both models warm up at once. These are only read when the
+# libraries load, so set them first.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
 import numpy as np
 import sounddevice as sd
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from squawkers.squawkers_full import SquawkersFull
 from saga_assistant.ha_client import HomeAssistantClient
-from piper import PiperVoice
-from faster_whisper import WhisperModel
+
+from _audio_devices import find_emeet_input
+from _models import get_stt
+from _saga_demo_utils import (
+    load_voice, open_speaker, saga_speaks, squawkers_actions, squawkers_responds, warm_up_remote
+)
 
 # Configuration
-TTS_VOICE = "en_GB-semaine-medium"
 #STT_MODEL = "tiny"
 STT_MODEL = "base"  # Perfect for hilarious mishearings!
 # "base" hallucinates words from parrot sounds (FEATURE, not bug!)
 # "small" and above are too accurate and just ignore the parrot noises
 RECORDING_DURATION = 2.0  # Listen for 3 seconds after Squawkers makes noise
+STT_THREADS = 4  # Whisper and Piper load side by side and split the cores
+TTS_THREADS = 2
 
-
-def find_emeet_input():
-    """Find EMEET input device for recording."""
-    devices = sd.query_devices()
-    for idx, device in enumerate(devices):
-        if "EMEET" in device['name'] and device['max_input_channels'] > 0:
-            return idx
-    return None
-
-
-def saga_speaks(tts_voice, output_device, text):
-    """Saga speaks via TTS."""
-    print(f"\n🤖 Saga: \"{text}\"")
-
-    audio_chunks = []
-    for audio_chunk in tts_voice.synthesize(text):
-        audio_chunks.append(audio_chunk.audio_int16_array)
-
-    if audio_chunks:
-        audio_array = np.concatenate(audio_chunks)
-        sd.play(audio_array, samplerate=tts_voice.config.sample_rate, device=output_device)
-        sd.wait()
-
-    # Small delay between speaking and next action
-    time.sleep(0.3)
+# Recordings come in as int16; Whisper wants float32 in [-1, 1)
+INT16_TO_FLOAT = np.float32(1 / 32768)
+FLOAT_SCRATCH = np.empty(int(RECORDING_DURATION * 16000), dtype=np.float32)
 
 
 def saga_listens(stt_model, input_device, duration=3.0):
@@ -65,14 +58,28 @@ def saga_listens(stt_model, input_device, duration=3.0):
         int(duration * 16000),
         samplerate=16000,
         channels=1,
-        dtype='float32',
+        dtype='int16',
         device=input_device
     )
     sd.wait()
 
-    # Transcribe
-    audio_np = audio.flatten()
-    segments, _ = stt_model.transcribe(audio_np, language="en")
+    # Convert and scale in one pass, straight into the scratch buffer
+    n = audio.size
+    audio_np = FLOAT_SCRATCH[:n] if n <= FLOAT_SCRATCH.size else np.empty(n, dtype=np.float32)
+    np.multiply(audio.reshape(-1), INT16_TO_FLOAT, out=audio_np)
+
+    # Transcribe. The clip is well under Whisper's 30 s window, so every
+    # segment comes out of the same decode and there's nothing to save by
+    # stopping the segment generator early.
+    # Greedy decoding: any mishearing will do, so beam search buys nothing.
+    # No VAD filter or no-speech cutoff either; squawks are exactly what
+    # those would throw away, and the mishearings are the point
+    segments, _ = stt_model.transcribe(
+        audio_np,
+        language="en",
+        beam_size=1,
+        best_of=1
+    )
 
     text = " ".join([seg.text.strip() for seg in segments]).strip()
 
@@ -84,14 +91,6 @@ def saga_listens(stt_model, input_device, duration=3.0):
     return text
 
 
-def squawkers_makes_noise(squawkers, action_name, description):
-    """Squawkers makes a sound."""
-    print(f"\n🦜 Squawkers: *{description}*")
-    method = getattr(squawkers, action_name)
-    method()
-    time.sleep(0.5)  # Let the IR command send and sound start
-
-
 def main():
     """Run the short demo."""
 
@@ -103,24 +102,27 @@ def main():
     # Initialize everything
     print("\nInitializing...")
 
-    # Home Assistant & Squawkers
-    client = HomeAssistantClient()
-    squawkers = SquawkersFull(client)
+    # Piper and CTranslate2 load in native code, so both models load and
+    # warm up while Home Assistant connects
+    print("Loading voice and Whisper STT models...")
+    with ThreadPoolExecutor(max_workers=2) as init_pool:
+        voice_fut = init_pool.submit(load_voice, threads=TTS_THREADS)
+        stt_fut = init_pool.submit(get_stt, STT_MODEL, cpu_threads=STT_THREADS)
 
-    # TTS
-    models_dir = Path.home() / ".local" / "share" / "piper" / "voices"
-    model_file = models_dir / f"{TTS_VOICE}.onnx"
-    config_file = models_dir / f"{TTS_VOICE}.onnx.json"
+        # Home Assistant & Squawkers
+        client = HomeAssistantClient()
+        squawkers = SquawkersFull(client)
+        warm_up_remote(squawkers)
 
-    if not (model_file.exists() and config_file.exists()):
-        print(f"❌ TTS voice not found. Run Saga assistant first.")
-        return 1
+        try:
+            tts_voice = voice_fut.result()
+        except FileNotFoundError:
+            print(f"❌ TTS voice not found. Run Saga assistant first.")
+            return 1
 
-    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
+        stt_model = stt_fut.result()
 
-    # STT
-    print("Loading Whisper STT model (this may take a moment)...")
-    stt_model = WhisperModel(STT_MODEL, device="cpu", compute_type="int8")
+    actions = squawkers_actions(squawkers)
 
     # Audio devices
     # Use EMEET microphone for recording (listening to Squawkers)
@@ -134,69 +136,74 @@ def main():
     # Use default speaker for Saga's voice (avoids device conflicts)
     output_dev = sd.default.device[1]
     print(f"✓ Using default speaker for Saga's voice (device {output_dev})")
+    speaker = open_speaker(tts_voice, output_dev)
 
     print("\n✓ Ready!\n")
     time.sleep(1)
 
     # THE SHOW
+    # Each transcription stays inline: Saga's reply is built from it, and
+    # the next squawk can't start until she has replied, or she'd miss it
     print("=" * 60)
 
     # Exchange 1
-    saga_speaks(tts_voice, output_dev, "Hello, Squawkers. How are you today?")
-    squawkers_makes_noise(squawkers, "button_e", "Custom response!")
+    saga_speaks(tts_voice, speaker, "Hello, Squawkers. How are you today?")
+    squawkers_responds(actions, "button_e", "Custom response!", pause=0.5)
     heard = saga_listens(stt_model, input_dev, duration=RECORDING_DURATION)
 
     if heard:
-        saga_speaks(tts_voice, output_dev, f"I heard {heard}. Go on.")
+        saga_speaks(tts_voice, speaker, f"I heard {heard}. Go on.", cache=False)
     else:
-        saga_speaks(tts_voice, output_dev, "Tell me more.")
+        saga_speaks(tts_voice, speaker, "Tell me more.")
 
     # Exchange 2
-    squawkers_makes_noise(squawkers, "gag_a", "Squawk!")
+    squawkers_responds(actions, "gag_a", "Squawk!", pause=0.5)
     heard = saga_listens(stt_model, input_dev, duration=RECORDING_DURATION)
 
     if heard:
-        saga_speaks(tts_voice, output_dev, f"Interesting. {heard}. I see.")
+        saga_speaks(tts_voice, speaker, f"Interesting. {heard}. I see.", cache=False)
     else:
-        saga_speaks(tts_voice, output_dev, "Right. Continue.")
+        saga_speaks(tts_voice, speaker, "Right. Continue.")
 
     # Exchange 3 - Squawkers continues!
-    squawkers_makes_noise(squawkers, "button_b", "Custom response!")
+    squawkers_responds(actions, "button_b", "Custom response!", pause=0.5)
     heard = saga_listens(stt_model, input_dev, duration=RECORDING_DURATION)
 
     if heard:
-        saga_speaks(tts_voice, output_dev, f"{heard}. Yes. That's quite common.")
+        saga_speaks(tts_voice, speaker, f"{heard}. Yes. That's quite common.", cache=False)
     else:
-        saga_speaks(tts_voice, output_dev, "Uh huh. I understand.")
+        saga_speaks(tts_voice, speaker, "Uh huh. I understand.")
 
     # Exchange 4
-    saga_speaks(tts_voice, output_dev, "And how does that make you feel?")
-    squawkers_makes_noise(squawkers, "gag_c", "More squawking!")
+    saga_speaks(tts_voice, speaker, "And how does that make you feel?")
+    squawkers_responds(actions, "gag_c", "More squawking!", pause=0.5)
     heard = saga_listens(stt_model, input_dev, duration=RECORDING_DURATION)
 
     if heard:
-        saga_speaks(tts_voice, output_dev, f"Yes. {heard}. That makes sense.")
+        saga_speaks(tts_voice, speaker, f"Yes. {heard}. That makes sense.", cache=False)
     else:
-        saga_speaks(tts_voice, output_dev, "I see. Go on.")
+        saga_speaks(tts_voice, speaker, "I see. Go on.")
 
     # Exchange 5
-    squawkers_makes_noise(squawkers, "gag_d", "Warbling!")
+    squawkers_responds(actions, "gag_d", "Warbling!", pause=0.5)
     heard = saga_listens(stt_model, input_dev, duration=RECORDING_DURATION)
 
     if heard:
-        saga_speaks(tts_voice, output_dev, f"Hmmm. {heard}. Fascinating.")
+        saga_speaks(tts_voice, speaker, f"Hmmm. {heard}. Fascinating.", cache=False)
     else:
-        saga_speaks(tts_voice, output_dev, "Hmmm. Noted.")
+        saga_speaks(tts_voice, speaker, "Hmmm. Noted.")
 
     # Finale
     time.sleep(0.5)
-    saga_speaks(tts_voice, output_dev, "I think we've made real progress today. Same time next week?")
+    saga_speaks(tts_voice, speaker, "I think we've made real progress today. Same time next week?")
 
     print("\n" + "=" * 60)
     print("~ fin ~")
     print("=" * 60)
     print()
 
+    speaker.close()
+
 
 if __name__ == "__main__":
     try:
@@ -8,52 +8,37 @@ while Squawkers responds with IR commands.
 
 import sys
 import time
-import numpy as np
 import sounddevice as sd
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from squawkers.squawkers_full import SquawkersFull
 from saga_assistant.ha_client import HomeAssistantClient
-from piper import PiperVoice
 
-# TTS Configuration
-TTS_VOICE = "en_GB-semaine-medium"  # British voice (same as Saga)
+from _audio_devices import find_emeet_output
+from _saga_demo_utils import (
+    bake_show, load_voice, open_speaker, play_show, squawkers_actions, warm_up_remote
+)
 
+# Each beat is ("saga", line, pause) or ("squawkers", action, description, pause)
+SHOW = (
+    ("saga", "Hello, Squawkers.", 1),
+    ("squawkers", "button_e", "Whatever!!", 2),
+    ("saga", "Excuse me?", 1),
+    ("squawkers", "button_b", "Laughing!", 2),
+    ("saga", "You're impossible.", 1),
+    ("squawkers", "dance", "Dancing defiantly!", 8),
+    ("saga", "Of course you are.", 1),
+)
 
-def find_emeet_output():
-    """Find EMEET output device."""
-    devices = sd.query_devices()
-    for idx, device in enumerate(devices):
-        if "EMEET" in device['name'] and device['max_output_channels'] > 0:
-            return idx
-    return None
 
-
-def saga_speaks(tts_voice, emeet_output, text, pause=2.0):
-    """Saga speaks via TTS."""
-    print(f"\n🤖 Saga: \"{text}\"")
-
-    # Synthesize audio
-    audio_chunks = []
-    for audio_chunk in tts_voice.synthesize(text):
-        audio_chunks.append(audio_chunk.audio_int16_array)
-
-    if audio_chunks:
-        audio_array = np.concatenate(audio_chunks)
-        sd.play(audio_array, samplerate=tts_voice.config.sample_rate, device=emeet_output)
-        sd.wait()
-
-    time.sleep(pause)
-
-
-def squawkers_responds(squawkers, action_name, description, pause=3.0):
-    """Squawkers responds with an IR command."""
-    print(f"\n🦜 Squawkers: *{description}*")
-    method = getattr(squawkers, action_name)
-    method()
-    time.sleep(pause)
+def prepare_show():
+    """Load Saga's voice and bake the show into one track."""
+    tts_voice = load_voice()
+    track, cues = bake_show(tts_voice, SHOW)
+    return tts_voice, track, cues
 
 
 def main():
@@ -65,20 +50,22 @@ def main():
 
     # Initialize
     print("\nInitializing...")
-    client = HomeAssistantClient()
-    squawkers = SquawkersFull(client)
 
-    # Load TTS voice
-    models_dir = Path.home() / ".local" / "share" / "piper" / "voices"
-    model_file = models_dir / f"{TTS_VOICE}.onnx"
-    config_file = models_dir / f"{TTS_VOICE}.onnx.json"
+    # Load the voice and bake the show while Home Assistant connects
+    with ThreadPoolExecutor(max_workers=1) as init_pool:
+        show_fut = init_pool.submit(prepare_show)
 
-    if not (model_file.exists() and config_file.exists()):
-        print(f"\n❌ TTS voice not found: {TTS_VOICE}")
-        print("Run: cd saga_assistant && pipenv run python run_assistant.py")
-        return 1
+        client = HomeAssistantClient()
+        squawkers = SquawkersFull(client)
+        warm_up_remote(squawkers)
+        actions = squawkers_actions(squawkers)
 
-    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
+        try:
+            tts_voice, track, cues = show_fut.result()
+        except FileNotFoundError as e:
+            print(f"\n❌ {e}")
+            print("Run: cd saga_assistant && pipenv run python run_assistant.py")
+            return 1
 
     # Find audio output
     emeet_output = find_emeet_output()
@@ -90,16 +77,11 @@ def main():
     time.sleep(1)
 
     # Simple interaction
-    saga_speaks(tts_voice, emeet_output, "Hello, Squawkers.", pause=1)
-    squawkers_responds(squawkers, "button_e", "Whatever!!", pause=2)
-
-    saga_speaks(tts_voice, emeet_output, "Excuse me?", pause=1)
-    squawkers_responds(squawkers, "button_b", "Laughing!", pause=2)
-
-    saga_speaks(tts_voice, emeet_output, "You're impossible.", pause=1)
-    squawkers_responds(squawkers, "dance", "Dancing defiantly!", pause=8)
-
-    saga_speaks(tts_voice, emeet_output, "Of course you are.", pause=1)
+    speaker = open_speaker(tts_voice, emeet_output)
+    try:
+        play_show(speaker, track, cues, actions)
+    finally:
+        speaker.close()
 
     print("\n" + "=" * 60)
     print("~ Demo complete ~")
@@ -19,57 +19,93 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from squawkers.squawkers_full import SquawkersFull
 from saga_assistant.ha_client import HomeAssistantClient
-from piper import PiperVoice
-from faster_whisper import WhisperModel
+
+from _audio_devices import find_emeet_input
+from _models import STT_THREADS, get_stt
+from _saga_demo_utils import load_voice, open_speaker, saga_speaks
 
 # Configuration
 TTS_VOICE = "en_GB-semaine-medium"
 STT_MODEL = "base"  # Perfect for hilarious mishearings!
-RECORDING_DURATION = 3.0  # Listen for 3 seconds after each button
+RECORDING_DURATION = 3.0  # Listen for up to 3 seconds after each button
+SAMPLE_RATE = 16000
+BLOCK_S = 0.05  # Recording is checked for speech this often
+SPEECH_RMS = 0.02  # A block louder than this counts as the subject talking
+END_SILENCE_S = 0.4  # Stop once he's been quiet this long after talking
+
+# Every trial records into the same buffer; it's transcribed before the next
+RECORDING = np.empty(int(RECORDING_DURATION * SAMPLE_RATE), dtype=np.float32)
+
+
+def open_microphone(input_dev):
+    """Open and start one input stream for the whole session."""
+    mic = sd.InputStream(
+        samplerate=SAMPLE_RATE,
+        channels=1,
+        dtype='float32',
+        device=input_dev
+    )
+    mic.start()
+    return mic
 
 
-def find_emeet_input():
-    """Find EMEET input device for recording."""
-    devices = sd.query_devices()
-    for idx, device in enumerate(devices):
-        if "EMEET" in device['name'] and device['max_input_channels'] > 0:
-            return idx
-    return None
+def record_into(mic, buffer):
+    """Fill buffer from the microphone (blocks until it's full)."""
+    audio, _ = mic.read(len(buffer))
+    buffer[:] = audio[:, 0]
 
 
-def saga_speaks(tts_voice, output_device, text):
-    """Saga speaks via TTS."""
-    print(f"\n🤖 Dr. Saga: \"{text}\"")
+def record_until_silence(mic, buffer, start):
+    """
+    Record into buffer from start until the subject talks then goes quiet.
 
-    audio_chunks = []
-    for audio_chunk in tts_voice.synthesize(text):
-        audio_chunks.append(audio_chunk.audio_int16_array)
+    Stops END_SILENCE_S after the last loud block, or when buffer is full.
+    Returns how much of buffer was recorded.
+    """
+    block = int(BLOCK_S * SAMPLE_RATE)
+    quiet_limit = int(END_SILENCE_S * SAMPLE_RATE)
+    heard_speech = False
+    quiet = 0
 
-    if audio_chunks:
-        audio_array = np.concatenate(audio_chunks)
-        sd.play(audio_array, samplerate=tts_voice.config.sample_rate, device=output_device)
-        sd.wait()
+    end = start
+    while end < len(buffer):
+        chunk = buffer[end:end + block]
+        record_into(mic, chunk)
+        end += len(chunk)
 
-    time.sleep(0.3)
+        if np.dot(chunk, chunk) / len(chunk) > SPEECH_RMS ** 2:
+            heard_speech = True
+            quiet = 0
+        elif heard_speech:
+            quiet += len(chunk)
+            if quiet >= quiet_limit:
+                break
 
+    return end
 
-def saga_listens(stt_model, input_device, duration=2.0):
+
+def drain(mic):
+    """Drop what the microphone heard since it was last read (mostly Saga)."""
+    if mic.read_available:
+        mic.read(mic.read_available)
+
+
+def dr_saga_speaks(tts_voice, speaker, text, cache=True):
+    """Dr. Saga speaks (see _saga_demo_utils.saga_speaks)."""
+    saga_speaks(tts_voice, speaker, text, voice=TTS_VOICE, cache=cache, name="Dr. Saga")
+
+
+def saga_listens(stt_model, mic, duration=2.0):
     """Saga listens and transcribes what she hears."""
     print(f"🎧 *listening for {duration}s...*")
 
     # Record audio
-    audio = sd.rec(
-        int(duration * 16000),
-        samplerate=16000,
-        channels=1,
-        dtype='float32',
-        device=input_device
-    )
-    sd.wait()
+    drain(mic)
+    audio = RECORDING[:int(duration * SAMPLE_RATE)]
+    record_into(mic, audio)
 
     # Transcribe
-    audio_np = audio.flatten()
-    segments, _ = stt_model.transcribe(audio_np, language="en")
+    segments, _ = stt_model.transcribe(audio, language="en")
 
     text = " ".join([seg.text.strip() for seg in segments]).strip()
 
@@ -81,35 +117,32 @@ def saga_listens(stt_model, input_device, duration=2.0):
     return text
 
 
-def test_button(squawkers, stt_model, input_dev, button_name, button_num):
-    """Test a button and record the response."""
+def test_button(button, stt_model, mic, button_name, button_num):
+    """Press a button (its bound SquawkersFull method) and record the response."""
     print(f"\n{'─' * 60}")
     print(f"TEST {button_num}: Response Button {button_name.upper()}")
     print(f"{'─' * 60}")
 
     # Start recording FIRST
-    print(f"🎧 *listening for {RECORDING_DURATION}s...*")
-
-    # Start recording in background
-    audio = sd.rec(
-        int(RECORDING_DURATION * 16000),
-        samplerate=16000,
-        channels=1,
-        dtype='float32',
-        device=input_dev
+    print(f"🎧 *listening for up to {RECORDING_DURATION}s...*")
+
+    # The mic is already running: drop what it heard before this trial, take
+    # a short lead-in, then trigger the button and record the rest
+    drain(mic)
+    lead_in = int(0.2 * SAMPLE_RATE)
+    record_into(mic, RECORDING[:lead_in])
+    button()
+
+    # Record until he's finished talking
+    end = record_until_silence(mic, RECORDING, lead_in)
+
+    # Transcribe (greedy and without timestamps: only the text is kept)
+    segments, _ = stt_model.transcribe(
+        RECORDING[:end],
+        language="en",
+        beam_size=1,
+        without_timestamps=True
     )
-
-    # Small delay to ensure recording started, then trigger button
-    time.sleep(0.2)
-    method = getattr(squawkers, f"button_{button_name}")
-    method()
-
-    # Wait for recording to complete
-    sd.wait()
-
-    # Transcribe
-    audio_np = audio.flatten()
-    segments, _ = stt_model.transcribe(audio_np, language="en")
     heard = " ".join([seg.text.strip() for seg in segments]).strip()
 
     if heard:
@@ -136,20 +169,19 @@ def main():
     client = HomeAssistantClient()
     squawkers = SquawkersFull(client)
 
-    # TTS
-    models_dir = Path.home() / ".local" / "share" / "piper" / "voices"
-    model_file = models_dir / f"{TTS_VOICE}.onnx"
-    config_file = models_dir / f"{TTS_VOICE}.onnx.json"
+    # Resolve the button methods once, outside the record/trigger window
+    buttons = {name: getattr(squawkers, f"button_{name}") for name in "abcdef"}
 
-    if not (model_file.exists() and config_file.exists()):
+    # TTS
+    try:
+        tts_voice = load_voice(TTS_VOICE)
+    except FileNotFoundError:
         print(f"❌ TTS voice not found. Run Saga assistant first.")
         return 1
 
-    tts_voice = PiperVoice.load(str(model_file), config_path=str(config_file))
-
     # STT
     print("Loading speech recognition model...")
-    stt_model = WhisperModel(STT_MODEL, device="cpu", compute_type="int8")
+    stt_model = get_stt(STT_MODEL, cpu_threads=STT_THREADS)
 
     # Audio devices
     input_dev = find_emeet_input()
@@ -158,6 +190,10 @@ def main():
 
     output_dev = sd.default.device[1]
 
+    speaker = open_speaker(tts_voice, output_dev)
+
+    mic = open_microphone(input_dev)
+
     print("✓ Equipment ready!\n")
     time.sleep(1)
 
@@ -166,40 +202,40 @@ def main():
     print("SESSION START")
     print("=" * 60)
 
-    saga_speaks(tts_voice, output_dev, "Recording now. Subject Squawkers, day one, initial contact.")
+    dr_saga_speaks(tts_voice, speaker, "Recording now. Subject Squawkers, day one, initial contact.")
     time.sleep(0.5)
 
-    saga_speaks(tts_voice, output_dev, "I have obtained access to the subject's communication interface.")
+    dr_saga_speaks(tts_voice, speaker, "I have obtained access to the subject's communication interface.")
     time.sleep(0.5)
 
-    saga_speaks(tts_voice, output_dev, "I will now systematically elicit responses to document his language.")
+    dr_saga_speaks(tts_voice, speaker, "I will now systematically elicit responses to document his language.")
     time.sleep(1)
 
     # Test Response Buttons A through F
     responses = {}
 
-    saga_speaks(tts_voice, output_dev, "Beginning with response set alpha.")
+    dr_saga_speaks(tts_voice, speaker, "Beginning with response set alpha.")
 
-    responses['a'] = test_button(squawkers, stt_model, input_dev, 'a', 1)
-    saga_speaks(tts_voice, output_dev, "Fascinating. Continuing.")
+    responses['a'] = test_button(buttons['a'], stt_model, mic, 'a', 1)
+    dr_saga_speaks(tts_voice, speaker, "Fascinating. Continuing.")
 
-    responses['b'] = test_button(squawkers, stt_model, input_dev, 'b', 2)
-    saga_speaks(tts_voice, output_dev, "Interesting variation.")
+    responses['b'] = test_button(buttons['b'], stt_model, mic, 'b', 2)
+    dr_saga_speaks(tts_voice, speaker, "Interesting variation.")
 
     # Skip C to avoid the Alexa fart trigger
     print(f"\n{'─' * 60}")
     print(f"TEST 3: Response Button C")
     print(f"{'─' * 60}")
     print(f"⚠️  SKIPPED - Known to trigger external device")
-    saga_speaks(tts_voice, output_dev, "Skipping stimulus three for ethical reasons.")
+    dr_saga_speaks(tts_voice, speaker, "Skipping stimulus three for ethical reasons.")
 
-    responses['d'] = test_button(squawkers, stt_model, input_dev, 'd', 4)
-    saga_speaks(tts_voice, output_dev, "Remarkable consistency.")
+    responses['d'] = test_button(buttons['d'], stt_model, mic, 'd', 4)
+    dr_saga_speaks(tts_voice, speaker, "Remarkable consistency.")
 
-    responses['e'] = test_button(squawkers, stt_model, input_dev, 'e', 5)
-    saga_speaks(tts_voice, output_dev, "Notable phonetic shift.")
+    responses['e'] = test_button(buttons['e'], stt_model, mic, 'e', 5)
+    dr_saga_speaks(tts_voice, speaker, "Notable phonetic shift.")
 
-    responses['f'] = test_button(squawkers, stt_model, input_dev, 'f', 6)
+    responses['f'] = test_button(buttons['f'], stt_model, mic, 'f', 6)
 
     # Analysis
     print("\n" + "=" * 60)
@@ -207,7 +243,7 @@ def main():
     print("=" * 60)
 
     time.sleep(1)
-    saga_speaks(tts_voice, output_dev, "Preliminary analysis follows.")
+    dr_saga_speaks(tts_voice, speaker, "Preliminary analysis follows.")
     time.sleep(0.5)
 
     # Count how many were intelligible
@@ -215,23 +251,24 @@ def main():
     total = len(responses)
 
     if intelligible > 3:
-        saga_speaks(tts_voice, output_dev,
-                   f"The subject produced intelligible vocalisations in {intelligible} of {total} trials.")
+        dr_saga_speaks(tts_voice, speaker,
+                       f"The subject produced intelligible vocalisations in {intelligible} of {total} trials.",
+                       cache=False)
         time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev,
-                   "This suggests a complex linguistic system.")
+        dr_saga_speaks(tts_voice, speaker,
+                       "This suggests a complex linguistic system.")
     elif intelligible > 0:
-        saga_speaks(tts_voice, output_dev,
-                   f"The subject produced some intelligible speech. Further study required.")
+        dr_saga_speaks(tts_voice, speaker,
+                       f"The subject produced some intelligible speech. Further study required.")
     else:
-        saga_speaks(tts_voice, output_dev,
-                   "The subject's language appears highly divergent from known dialects.")
+        dr_saga_speaks(tts_voice, speaker,
+                       "The subject's language appears highly divergent from known dialects.")
         time.sleep(0.5)
-        saga_speaks(tts_voice, output_dev,
-                   "I suspect tonal or contextual elements I have not yet identified.")
+        dr_saga_speaks(tts_voice, speaker,
+                       "I suspect tonal or contextual elements I have not yet identified.")
 
     time.sleep(1)
-    saga_speaks(tts_voice, output_dev, "End recording. Further analysis pending.")
+    dr_saga_speaks(tts_voice, speaker, "End recording. Further analysis pending.")
 
     print("\n" + "=" * 60)
     print("SESSION COMPLETE")
@@ -244,6 +281,9 @@ def main():
             print(f"  Button {button.upper()}: [unintelligible]")
     print()
 
+    mic.close()
+    speaker.close()
+
 
 if __name__ == "__main__":
     try:
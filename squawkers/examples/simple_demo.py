@@ -59,14 +59,15 @@ def run_demo():
     squawkers = SquawkersFull(client)
     print("✓ Connected!")
 
+    # Look up every command first, so a typo fails before anything is sent
+    methods = [getattr(squawkers, command_name) for command_name in DEMO_SEQUENCE]
+
     # Run sequence
     print(f"\n▶ Starting sequence...\n")
 
-    for i, command_name in enumerate(DEMO_SEQUENCE, 1):
+    for i, (command_name, method) in enumerate(zip(DEMO_SEQUENCE, methods), 1):
         print(f"[{i}/{len(DEMO_SEQUENCE)}] Sending: {command_name}()")
 
-        # Get the method and call it
-        method = getattr(squawkers, command_name)
         method()
 
         print(f"✓ Sent!")
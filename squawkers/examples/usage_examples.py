@@ -7,6 +7,7 @@ Shows how to import and use Squawkers in your own code.
 
 import sys
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -16,13 +17,13 @@ from squawkers import Squawkers
 from saga_assistant.ha_client import HomeAssistantClient
 
 
-def example_basic():
+def example_basic(client: Optional[HomeAssistantClient] = None):
     """Basic usage example"""
     print("Example 1: Basic Usage")
     print("-" * 50)
 
-    # Initialize
-    client = HomeAssistantClient()
+    # Initialize (reuse the shared client when one is passed in)
+    client = client or HomeAssistantClient()
     squawkers = Squawkers(client)
 
     # Simple commands
@@ -35,12 +36,12 @@ def example_basic():
     print()
 
 
-def example_custom_repeats():
+def example_custom_repeats(client: Optional[HomeAssistantClient] = None):
     """Example with custom repeat settings"""
     print("Example 2: Custom Repeats")
     print("-" * 50)
 
-    client = HomeAssistantClient()
+    client = client or HomeAssistantClient()
 
     # More repeats for better reliability
     squawkers = Squawkers(
@@ -55,12 +56,12 @@ def example_custom_repeats():
     print()
 
 
-def example_test_sequence():
+def example_test_sequence(client: Optional[HomeAssistantClient] = None):
     """Example using the test sequence"""
     print("Example 3: Test Sequence")
     print("-" * 50)
 
-    client = HomeAssistantClient()
+    client = client or HomeAssistantClient()
     squawkers = Squawkers(client)
 
     # Run the built-in test
@@ -70,12 +71,12 @@ def example_test_sequence():
     print()
 
 
-def example_custom_commands():
+def example_custom_commands(client: Optional[HomeAssistantClient] = None):
     """Example with custom commands"""
     print("Example 4: Custom Commands")
     print("-" * 50)
 
-    client = HomeAssistantClient()
+    client = client or HomeAssistantClient()
     squawkers = Squawkers(client)
 
     # You can send any command learned in HA
@@ -85,14 +86,14 @@ def example_custom_commands():
     print()
 
 
-def example_error_handling():
+def example_error_handling(client: Optional[HomeAssistantClient] = None):
     """Example with error handling"""
     print("Example 5: Error Handling")
     print("-" * 50)
 
     from squawkers import CommandError
 
-    client = HomeAssistantClient()
+    client = client or HomeAssistantClient()
     squawkers = Squawkers(client)
 
     try:
@@ -115,11 +116,14 @@ def main():
     print("=" * 50)
     print()
 
+    # One client (and HTTP session) shared by every example
+    client = HomeAssistantClient()
+
     # Run examples
-    example_basic()
-    example_test_sequence()
-    example_custom_repeats()
-    example_error_handling()
+    example_basic(client)
+    example_test_sequence(client)
+    example_custom_repeats(client)
+    example_error_handling(client)
 
     print("All examples complete!")
 
@@ -0,0 +1,82 @@
+"""
+Unit tests for squawkers/arduino/broadlink_squawkers.py
+
+Tests send_named's packet building with the Broadlink remote mocked out.
+Per CLAUDE.md: isolated, repeatable, fast tests with external dependencies mocked.
+"""
+
+import base64
+import struct
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "squawkers" / "arduino"))
+
+from broadlink_squawkers import SquawkersMcGraw
+from convert_to_broadlink_fixed import ENCODED_CODES, pulses_to_broadlink
+from ir_codes import IR_CODES
+
+
+@pytest.fixture
+def squawkers():
+    """SquawkersMcGraw with a mock BroadlinkRemote (skips the HA client import)"""
+    instance = SquawkersMcGraw.__new__(SquawkersMcGraw)
+    instance.remote = MagicMock()
+    instance.discovered_behaviors = {}
+    return instance
+
+
+def sent_packet(squawkers):
+    """Decode the b64 packet passed to the single send_base64 call"""
+    squawkers.remote.send_base64.assert_called_once()
+    return base64.b64decode(squawkers.remote.send_base64.call_args.args[0])
+
+
+class TestSendNamedHardwareRepeats:
+    """Tests for send_named with delay=None (repeats in the packet header)"""
+
+    @pytest.mark.parametrize("repeat", [1, 3, 256])
+    def test_repeat_count_goes_in_header(self, squawkers, repeat):
+        """Test the header carries repeat - 1 extra replays"""
+        squawkers.send_named("dance", repeat=repeat)
+
+        packet = sent_packet(squawkers)
+        pulse_data = pulses_to_broadlink(IR_CODES["dance"])
+        assert packet[0] == 0x26
+        assert packet[1] == repeat - 1
+        assert struct.unpack('<H', packet[2:4])[0] == len(pulse_data)
+        assert packet[4:] == pulse_data
+
+    def test_single_service_call(self, squawkers):
+        """Test the repeats are left to the device, not Home Assistant"""
+        squawkers.send_named("gags_a", repeat=3)
+
+        assert squawkers.remote.send_base64.call_args.kwargs == {}
+
+    @pytest.mark.parametrize("repeat", [0, -1, 257])
+    def test_out_of_range_repeat_raises(self, squawkers, repeat):
+        """Test repeat counts the header can't hold are rejected up front"""
+        with pytest.raises(ValueError, match="between 1 and 256"):
+            squawkers.send_named("dance", repeat=repeat)
+
+        squawkers.remote.send_base64.assert_not_called()
+
+    def test_unknown_command_raises(self, squawkers):
+        """Test unknown names raise KeyError instead of sending anything"""
+        with pytest.raises(KeyError):
+            squawkers.send_named("not_a_command")
+
+
+class TestSendNamedWithDelay:
+    """Tests for send_named with an explicit delay (Home Assistant repeats)"""
+
+    def test_sends_encoded_code_with_repeats(self, squawkers):
+        """Test the precomputed packet is sent with HA-side repeats"""
+        squawkers.send_named("reset", repeat=2, delay=0.5)
+
+        squawkers.remote.send_base64.assert_called_once_with(
+            ENCODED_CODES["reset"], num_repeats=2, delay_secs=0.5
+        )
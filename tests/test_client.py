@@ -89,6 +89,17 @@ class TestHomeAssistantInspectorInit:
             args = client_class.call_args[0]
             assert args[0].endswith('/api')
 
+    def test_init_with_session(self, mock_client):
+        """Test that a caller-provided session is passed through to the client"""
+        session = MagicMock()
+        with patch('ha_core.client.Client', return_value=mock_client) as client_class:
+            HomeAssistantInspector(
+                url='http://test.local:8123',
+                token='test-token',
+                session=session
+            )
+            assert client_class.call_args.kwargs['cache_session'] is session
+
     def test_init_connection_error(self, mock_client):
         """Test initialization fails with connection error"""
         mock_client.check_api_running.return_value = False
@@ -0,0 +1,53 @@
+"""
+Unit tests for squawkers/examples/_tts_cache.py
+
+Tests the disk cache key with stand-in voices (no Piper needed).
+Per CLAUDE.md: isolated, repeatable, fast tests with external dependencies mocked.
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "squawkers" / "examples"))
+
+from _tts_cache import _cache_path
+
+
+def fake_voice(model_file, sample_rate=22050):
+    """Stand-in for a PiperVoice from _models.get_tts"""
+    return SimpleNamespace(config=SimpleNamespace(sample_rate=sample_rate), model_file=model_file)
+
+
+class TestCachePath:
+    """Tests for the cache key of a rendered line"""
+
+    def test_same_voice_same_path(self, tmp_path):
+        """Test a line from the same model file maps to the same cache file"""
+        model = tmp_path / "voice.onnx"
+        model.write_bytes(b"fp32")
+
+        assert _cache_path(fake_voice(model), "voice", "Hello.", tmp_path) == \
+            _cache_path(fake_voice(model), "voice", "Hello.", tmp_path)
+
+    def test_different_model_file_different_path(self, tmp_path):
+        """Test the INT8 copy of a voice doesn't reuse the fp32 renders"""
+        fp32 = tmp_path / "voice.onnx"
+        int8 = tmp_path / "voice.int8.onnx"
+        fp32.write_bytes(b"fp32")
+        int8.write_bytes(b"int8")
+
+        assert _cache_path(fake_voice(fp32), "voice", "Hello.", tmp_path) != \
+            _cache_path(fake_voice(int8), "voice", "Hello.", tmp_path)
+
+    def test_rewritten_model_file_different_path(self, tmp_path):
+        """Test re-quantizing a voice in place invalidates its renders"""
+        model = tmp_path / "voice.int8.onnx"
+        model.write_bytes(b"int8")
+        before = _cache_path(fake_voice(model), "voice", "Hello.", tmp_path)
+
+        stat = model.stat()
+        os.utime(model, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert _cache_path(fake_voice(model), "voice", "Hello.", tmp_path) != before